@@ -35,7 +35,7 @@ class HrAttendance(models.Model):
         vals = {'check_out': leave_time}
         if reason:
             vals['attendance_reason_ids'] = [(4, reason.id)]
-        self.write(vals)
+        self.with_context(attendance_autoclose=True).write(vals)
 
     @api.multi
     def needs_autoclose(self):
@@ -49,18 +49,19 @@ class HrAttendance(models.Model):
     def check_for_incomplete_attendances(self):
         stale_attendances = self.search(
             [('check_out', '=', False)])
-        reason = self.env['hr.attendance.reason'].search(
-            [('code', '=', 'S-CO')], limit=1)
-        for att in stale_attendances.filtered(lambda a: a.needs_autoclose()):
-            att.autoclose_attendance(reason)
+        to_close = stale_attendances.filtered(lambda a: a.needs_autoclose())
+        # Tag all the attendances at once, so the checkouts below already
+        # skip the validity check
+        self.env['hr.attendance.reason'].add_reasons(to_close, 'S-CO')
+        for att in to_close:
+            att.autoclose_attendance(False)
 
     @api.constrains('check_in', 'check_out', 'employee_id')
     def _check_validity(self):
         """ If this is an automatic checkout the constraint is invalid
         as there may be old attendances not closed
         """
-        reason = self.env['hr.attendance.reason'].search(
-            [('code', '=', 'S-CO')], limit=1)
+        reason = self.env['hr.attendance.reason'].get_by_code('S-CO')
         if not reason:
             return super(HrAttendance, self)._check_validity()
         if self.filtered(lambda att:
@@ -5,7 +5,7 @@
     'name': 'Hr Attendance Modification Tracking',
     'summary': """
         Attendance changes will now be registered in the chatter.""",
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.1.1',
     'license': 'AGPL-3',
     'author': 'Creu Blanca,Odoo Community Association (OCA)',
     'website': 'https://github.com/OCA/hr',
@@ -14,7 +14,9 @@
         'mail',
     ],
     'data': [
+        'security/ir.model.access.csv',
         'views/hr_attendance_view.xml',
+        'views/res_company_view.xml',
     ],
     'installable': True,
 }
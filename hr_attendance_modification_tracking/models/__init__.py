@@ -1 +1,3 @@
 from . import hr_attendance
+from . import hr_attendance_modification_log
+from . import res_company
@@ -1,7 +1,7 @@
 # Copyright 2019 Creu Blanca
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import fields, models
+from odoo import api, fields, models
 
 
 class HrAttendance(models.Model):
@@ -17,3 +17,145 @@ class HrAttendance(models.Model):
     check_out = fields.Datetime(
         track_visibility='onchange'
     )
+    modification_log_ids = fields.One2many(
+        'hr.attendance.modification.log', 'attendance_id',
+        string='Modification Log', readonly=True,
+    )
+
+    @api.model
+    def _use_modification_log(self, company):
+        """ Changes are stored in the compact log instead of the chatter """
+        if self.env.context.get('tracking_disable'):
+            return False
+        return company.attendance_tracking_mode == 'log'
+
+    @api.model
+    def _skip_modification_log(self, company):
+        """ System-generated closures are only logged when configured """
+        return (
+            self.env.context.get('attendance_autoclose') and
+            not company.attendance_tracking_log_autoclose
+        )
+
+    @api.multi
+    def _get_modification_log_company(self):
+        self.ensure_one()
+        return self.employee_id.company_id or self.env.user.company_id
+
+    @api.multi
+    def _filter_modification_log(self):
+        """ Attendances whose changes are stored in the compact log """
+        return self.filtered(lambda attendance: self._use_modification_log(
+            attendance._get_modification_log_company()))
+
+    @api.multi
+    def _filter_logged_modifications(self):
+        """ Logged attendances whose current changes must be written """
+        return self.filtered(lambda attendance: not (
+            self._skip_modification_log(
+                attendance._get_modification_log_company())))
+
+    @api.model
+    def _format_modification_log_value(self, field, value):
+        if not value:
+            return False
+        if field.type == 'many2one':
+            return value.display_name
+        if field.type == 'datetime':
+            return fields.Datetime.to_string(value)
+        return str(value)
+
+    @api.multi
+    def _log_modifications(self, tracked_fields, initial_values):
+        ir_fields = self.env['ir.model.fields']
+        user_id = self.env.uid
+        now = fields.Datetime.to_string(fields.Datetime.now())
+        rows = []
+        for attendance in self:
+            old_values = initial_values[attendance.id]
+            for name in tracked_fields:
+                field = self._fields[name]
+                old_value = old_values[name]
+                new_value = attendance[name]
+                if old_value == new_value:
+                    continue
+                rows.append((
+                    attendance.id,
+                    ir_fields._get(self._name, name).id,
+                    self._format_modification_log_value(field, old_value),
+                    self._format_modification_log_value(field, new_value),
+                    user_id,
+                    now,
+                ))
+        self.env['hr.attendance.modification.log'].sudo()._append(rows)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        employees = self.env['hr.employee'].browse(list({
+            vals['employee_id'] for vals in vals_list
+            if vals.get('employee_id')
+        }))
+        default_company = self.env.user.company_id
+        log_indexes = {
+            index for index, vals in enumerate(vals_list)
+            if self._use_modification_log(
+                employees.browse(vals.get('employee_id')).company_id or
+                default_company)
+        }
+        if not log_indexes:
+            return super(HrAttendance, self).create(vals_list)
+        log_vals_list = [
+            vals for index, vals in enumerate(vals_list)
+            if index in log_indexes]
+        other_vals_list = [
+            vals for index, vals in enumerate(vals_list)
+            if index not in log_indexes]
+        others = self.browse()
+        if other_vals_list:
+            others = super(HrAttendance, self).create(other_vals_list)
+        logged = super(
+            HrAttendance, self.with_context(tracking_disable=True)
+        ).create(log_vals_list).with_env(self.env)
+        to_log = logged._filter_logged_modifications()
+        if to_log:
+            tracked_fields = self._get_tracked_fields(
+                list(set().union(*log_vals_list)))
+            if tracked_fields:
+                initial_values = {
+                    attendance.id: dict.fromkeys(tracked_fields, False)
+                    for attendance in to_log
+                }
+                to_log._log_modifications(tracked_fields, initial_values)
+        # return the attendances in the order of the values
+        logged_ids = iter(logged.ids)
+        other_ids = iter(others.ids)
+        return self.browse([
+            next(logged_ids) if index in log_indexes else next(other_ids)
+            for index in range(len(vals_list))
+        ])
+
+    @api.multi
+    def write(self, vals):
+        logged = self._filter_modification_log()
+        if not logged:
+            return super(HrAttendance, self).write(vals)
+        res = True
+        others = self - logged
+        if others:
+            res = super(HrAttendance, others).write(vals)
+        to_log = logged._filter_logged_modifications()
+        tracked_fields = {}
+        if to_log:
+            tracked_fields = self._get_tracked_fields(list(vals))
+        initial_values = {
+            attendance.id: {
+                name: attendance[name] for name in tracked_fields
+            }
+            for attendance in to_log
+        } if tracked_fields else {}
+        res = super(
+            HrAttendance, logged.with_context(tracking_disable=True)
+        ).write(vals) and res
+        if tracked_fields:
+            to_log._log_modifications(tracked_fields, initial_values)
+        return res
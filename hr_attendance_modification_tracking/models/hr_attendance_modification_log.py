@@ -0,0 +1,45 @@
+# Copyright 2019 Creu Blanca
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo import api, fields, models
+
+
+class HrAttendanceModificationLog(models.Model):
+    _name = 'hr.attendance.modification.log'
+    _description = 'Attendance Modification Log'
+    _order = 'date desc, id desc'
+    _log_access = False
+
+    attendance_id = fields.Many2one(
+        'hr.attendance', string='Attendance',
+        required=True, readonly=True, index=True, ondelete='cascade',
+    )
+    field_id = fields.Many2one(
+        'ir.model.fields', string='Field',
+        required=True, readonly=True, ondelete='cascade',
+    )
+    old_value = fields.Char(readonly=True)
+    new_value = fields.Char(readonly=True)
+    user_id = fields.Many2one(
+        'res.users', string='User', readonly=True, ondelete='set null',
+    )
+    date = fields.Datetime(readonly=True, index=True)
+
+    @api.model
+    def _append(self, rows):
+        """ Insert all the given log rows with a single statement.
+
+        :param rows: list of tuples (attendance_id, field_id, old_value,
+            new_value, user_id, date)
+        """
+        if not rows:
+            return
+        cr = self.env.cr
+        values = b','.join(
+            cr.mogrify('(%s, %s, %s, %s, %s, %s)', row) for row in rows)
+        cr.execute(
+            'INSERT INTO hr_attendance_modification_log '
+            '(attendance_id, field_id, old_value, new_value, user_id, date) '
+            'VALUES ' + values.decode())
+        self.env['hr.attendance'].invalidate_cache(
+            ['modification_log_ids'], list({row[0] for row in rows}))
@@ -0,0 +1,21 @@
+# Copyright 2019 Creu Blanca
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo import fields, models
+
+
+class ResCompany(models.Model):
+    _inherit = 'res.company'
+
+    attendance_tracking_mode = fields.Selection(
+        [('chatter', 'Chatter'),
+         ('log', 'Modification Log')],
+        string='Attendance Tracking Mode',
+        default='chatter', required=True,
+        help='Chatter: attendance changes are posted as tracking messages.\n'
+             'Modification Log: attendance changes are stored in a compact '
+             'log, without creating messages or followers.')
+    attendance_tracking_log_autoclose = fields.Boolean(
+        string='Log Automatic Closures',
+        help='Also log the changes made when attendances are closed '
+             'automatically by the system.')
@@ -0,0 +1 @@
+from . import test_hr_attendance_modification_tracking
@@ -0,0 +1,89 @@
+# Copyright 2019 Creu Blanca
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from datetime import datetime, timedelta
+
+from odoo.tests.common import TransactionCase
+
+
+class TestHrAttendanceModificationTracking(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.employee = self.env['hr.employee'].create({
+            'name': 'Employee',
+        })
+        self.company = self.env.user.company_id
+        self.check_in = datetime.now().replace(microsecond=0) - timedelta(
+            hours=8)
+
+    def test_chatter_mode(self):
+        self.company.attendance_tracking_mode = 'chatter'
+        attendance = self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': self.check_in,
+        })
+        attendance.write({'check_out': self.check_in + timedelta(hours=4)})
+        self.assertFalse(attendance.modification_log_ids)
+        self.assertTrue(attendance.message_ids)
+
+    def test_log_mode(self):
+        self.company.attendance_tracking_mode = 'log'
+        attendance = self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': self.check_in,
+        })
+        self.assertFalse(attendance.message_ids)
+        self.assertFalse(attendance.message_follower_ids)
+        self.assertEqual(len(attendance.modification_log_ids), 2)
+        check_out = self.check_in + timedelta(hours=4)
+        attendance.write({'check_out': check_out})
+        self.assertFalse(attendance.message_ids)
+        log = attendance.modification_log_ids.filtered(
+            lambda line: line.field_id.name == 'check_out')
+        self.assertEqual(len(log), 1)
+        self.assertFalse(log.old_value)
+        self.assertEqual(
+            log.new_value, check_out.strftime('%Y-%m-%d %H:%M:%S'))
+        self.assertEqual(log.user_id, self.env.user)
+
+    def test_log_mode_autoclose(self):
+        self.company.attendance_tracking_mode = 'log'
+        attendance = self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': self.check_in,
+        })
+        attendance.with_context(attendance_autoclose=True).write({
+            'check_out': self.check_in + timedelta(hours=4),
+        })
+        self.assertEqual(len(attendance.modification_log_ids), 2)
+        self.company.attendance_tracking_log_autoclose = True
+        attendance.with_context(attendance_autoclose=True).write({
+            'check_out': self.check_in + timedelta(hours=5),
+        })
+        self.assertEqual(len(attendance.modification_log_ids), 3)
+
+    def test_log_mode_employee_company(self):
+        self.company.attendance_tracking_mode = 'chatter'
+        company = self.env['res.company'].create({
+            'name': 'Company logging attendances',
+            'attendance_tracking_mode': 'log',
+        })
+        employee = self.env['hr.employee'].create({
+            'name': 'Employee 2',
+            'company_id': company.id,
+        })
+        attendances = self.env['hr.attendance'].create([{
+            'employee_id': employee.id,
+            'check_in': self.check_in,
+        }, {
+            'employee_id': self.employee.id,
+            'check_in': self.check_in,
+        }])
+        self.assertEqual(attendances.mapped('employee_id'),
+                         employee + self.employee)
+        self.assertEqual(len(attendances[0].modification_log_ids), 2)
+        self.assertFalse(attendances[1].modification_log_ids)
+        attendances.write({'check_out': self.check_in + timedelta(hours=4)})
+        self.assertEqual(len(attendances[0].modification_log_ids), 3)
+        self.assertFalse(attendances[1].modification_log_ids)
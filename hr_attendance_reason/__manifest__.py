@@ -4,7 +4,7 @@
 
 {
     'name': 'HR Attendance Reason',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.1.0',
     'category': 'Human Resources',
     'website': 'https://github.com/OCA/hr',
     'author': 'Odoo S.A.,'
@@ -2,7 +2,7 @@
 # Copyright 2018 Eficent Business and IT Consulting Services, S.L.
 # License LGPL-3 - See http://www.gnu.org/licenses/lgpl-3.0.html
 
-from odoo import fields, models
+from odoo import api, fields, models, tools
 
 
 class HrAttendanceReason(models.Model):
@@ -22,3 +22,70 @@ class HrAttendanceReason(models.Model):
         [('sign_in', 'Sign in'),
          ('sign_out', 'Sign out')],
         string="Action Type", help="Leave empty if it is independent")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.clear_caches()
+        return super().create(vals_list)
+
+    @api.multi
+    def write(self, vals):
+        if 'code' in vals:
+            self.clear_caches()
+        return super().write(vals)
+
+    @api.multi
+    def unlink(self):
+        self.clear_caches()
+        return super().unlink()
+
+    @api.model
+    @tools.ormcache('code')
+    def _get_id_by_code(self, code):
+        return self.sudo().search([('code', '=', code)], limit=1).id
+
+    @api.model
+    def get_by_code(self, codes):
+        """ Resolve reason codes into reasons, using a cache.
+
+        :param codes: a reason code or a list of reason codes
+        :return: recordset of the reasons found, unknown codes are ignored
+        """
+        if isinstance(codes, str):
+            codes = [codes]
+        return self.browse(
+            [reason_id for reason_id in map(self._get_id_by_code, codes)
+             if reason_id])
+
+    @api.model
+    def add_reasons(self, attendances, codes):
+        """ Tag all the attendances with the reasons of the given codes.
+
+        The relation is written with a single insert, so it is meant to be
+        used by crons and integrations processing many attendances.
+
+        :param attendances: recordset of hr.attendance
+        :param codes: a reason code or a list of reason codes
+        :return: recordset of the reasons added
+        """
+        reasons = self.get_by_code(codes)
+        if not attendances or not reasons:
+            return reasons
+        attendances.check_access_rights('write')
+        attendances.check_access_rule('write')
+        field = attendances._fields['attendance_reason_ids']
+        query = """
+            INSERT INTO {table} ({column1}, {column2})
+            SELECT att.id, reason.id
+            FROM unnest(%s) AS att(id)
+            CROSS JOIN unnest(%s) AS reason(id)
+            ON CONFLICT DO NOTHING
+        """.format(
+            table=field.relation,
+            column1=field.column1,
+            column2=field.column2,
+        )
+        self.env.cr.execute(query, (attendances.ids, reasons.ids))
+        attendances.invalidate_cache(
+            ['attendance_reason_ids'], attendances.ids)
+        return reasons
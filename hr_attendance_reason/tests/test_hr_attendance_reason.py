@@ -28,3 +28,25 @@ class TestHrAttendanceReason(TransactionCase):
             att.attendance_reason_ids.ids, self.att_reason.ids,
             "Bad Attendance Reason")
         self.employee.attendance_action_change()
+
+    def test_add_reasons(self):
+        atts = self.att_model.create([
+            {'employee_id': self.employee.id,
+             'check_in': '2019-01-01 08:00:00',
+             'check_out': '2019-01-01 12:00:00'},
+            {'employee_id': self.employee.id,
+             'check_in': '2019-01-02 08:00:00',
+             'check_out': '2019-01-02 12:00:00'},
+        ])
+        self.assertEqual(
+            self.att_reason_model.get_by_code(['BB', 'UNKNOWN']),
+            self.att_reason)
+        atts[0].write({'attendance_reason_ids': [(4, self.att_reason.id)]})
+        reasons = self.att_reason_model.add_reasons(atts, 'BB')
+        self.assertEqual(reasons, self.att_reason)
+        for att in atts:
+            self.assertEqual(att.attendance_reason_ids, self.att_reason)
+        self.att_reason.code = 'BC'
+        self.assertFalse(self.att_reason_model.get_by_code('BB'))
+        self.assertEqual(
+            self.att_reason_model.get_by_code('BC'), self.att_reason)
@@ -2,6 +2,7 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
 
 from odoo import models
+from odoo.osv import expression
 
 
 class HrLeave(models.Model):
@@ -23,11 +24,12 @@ class HrLeave(models.Model):
 
     def _check_theoretical_hours(self):
         """Recomputes all the theoretical hours that corresponds to the
-        interval of dates and employee of the leaves.
+        interval of dates and employee of the leaves, searching the
+        attendances of the whole recordset at once.
 
         :param: self: Leave recordset.
         """
-        to_recompute = self.env['hr.attendance']
+        domains = []
         for record in self.filtered(lambda x: x.date_from and x.date_to):
             from_datetime = record.date_from.replace(
                 hour=0, minute=0, second=0, microsecond=0,
@@ -35,9 +37,14 @@ class HrLeave(models.Model):
             to_datetime = record.date_to.replace(
                 hour=23, minute=59, second=59, microsecond=99999,
             )
-            to_recompute |= self.env['hr.attendance'].search([
+            domains.append([
                 ('employee_id', '=', record.employee_id.id),
                 ('check_in', '>=', from_datetime),
                 ('check_in', '<=', to_datetime),
             ])
+        if not domains:
+            return
+        to_recompute = self.env['hr.attendance'].search(
+            expression.OR(domains),
+        )
         to_recompute._compute_theoretical_hours()
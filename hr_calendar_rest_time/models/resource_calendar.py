@@ -1,7 +1,7 @@
 # Copyright 2020 Creu Blanca
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import api, models
+from odoo import api, models, tools
 from odoo.tools.float_utils import float_round
 
 
@@ -24,3 +24,18 @@ class ResourceCalendar(models.Model):
             self.hours_per_day = float_round(
                 hour_count / float(len(set(attendances.mapped('dayofweek')))),
                 precision_digits=2)
+
+    @api.multi
+    @tools.ormcache('self.id')
+    def _get_rest_time_map(self):
+        """ Rest time of the attendances of the calendar having one, as
+        plain floats taken from the compiled calendar template. The cache
+        is cleared when attendances are modified.
+        """
+        self.ensure_one()
+        return {
+            line['id']: line['rest_time']
+            for lines in self._get_attendance_template()
+            for line in lines
+            if line['rest_time']
+        }
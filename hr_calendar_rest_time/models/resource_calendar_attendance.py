@@ -27,3 +27,9 @@ class ResourceCalendarAttendance(models.Model):
                 raise ValidationError(
                     _('Rest time cannot be greater than the interval time')
                 )
+
+    @api.multi
+    def _get_template_values(self):
+        values = super()._get_template_values()
+        values['rest_time'] = self.rest_time
+        return values
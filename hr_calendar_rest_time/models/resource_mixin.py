@@ -2,13 +2,25 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
 from odoo import models
-from datetime import timedelta
 
 
 class ResourceMixin(models.AbstractModel):
     _inherit = 'resource.mixin'
 
-    def _get_work_hours(self, start, stop, meta):
-        return (stop - start - timedelta(hours=sum([
-            attendance.rest_time for attendance in meta
-        ]))).total_seconds() / 3600
+    def _get_intervals_work_hours(self, calendar, intervals):
+        rest_times = calendar._get_rest_time_map()
+        return [
+            hours - sum(
+                rest_times.get(attendance_id, 0.0)
+                for attendance_id in meta.ids
+            )
+            for hours, (start, stop, meta) in zip(
+                super()._get_intervals_work_hours(calendar, intervals),
+                intervals,
+            )
+        ]
+
+    def _get_template_work_hours(self, hour_from, hour_to, lines):
+        return super()._get_template_work_hours(
+            hour_from, hour_to, lines
+        ) - sum(line['rest_time'] for line in lines)
@@ -1,6 +1,8 @@
 # Copyright 2019 Creu Blanca
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+from unittest.mock import patch
+
 from odoo.tests.common import TransactionCase
 from odoo import fields
 from odoo.exceptions import ValidationError
@@ -56,3 +58,46 @@ class HRCalendarRestTime(TransactionCase):
         self.calendar.attendance_ids[0].write({'rest_time': 2})
         self.calendar.attendance_ids[0]._onchange_rest_time()
         self.assertEqual(self.calendar.attendance_ids[0].day_period, 'all_day')
+
+    def test_rest_time_days(self):
+        """Days are computed against the total hours of the day, rest time
+        excluded"""
+        self.employee.tz = 'UTC'
+        today = fields.Date.from_string(fields.Date.today())
+        data = self.employee.get_work_days_data(
+            datetime.combine(today, time(8, 0)),
+            datetime.combine(today, time(12, 0)),
+        )
+        self.assertEqual(data['hours'], 3.0)
+        self.assertEqual(data['days'], 0.5)
+        self.calendar.attendance_ids.write({'rest_time': 0.0})
+        data = self.employee.get_work_days_data(
+            datetime.combine(today, time(8, 0)),
+            datetime.combine(today, time(12, 30)),
+        )
+        self.assertEqual(data['hours'], 4.5)
+        self.assertEqual(data['days'], 0.5)
+
+    def test_rest_time_map(self):
+        attendances = self.calendar.attendance_ids
+        rest_times = self.calendar._get_rest_time_map()
+        for attendance in attendances:
+            self.assertEqual(rest_times[attendance.id], 1.0)
+        attendances[0].rest_time = 0.0
+        rest_times = self.calendar._get_rest_time_map()
+        self.assertNotIn(attendances[0].id, rest_times)
+        self.assertEqual(rest_times[attendances[1].id], 1.0)
+
+    def test_rest_time_map_once(self):
+        """The rest times are read once for all the intervals"""
+        self.employee.tz = 'UTC'
+        calendar_class = type(self.env['resource.calendar'])
+        with patch.object(
+            calendar_class, '_get_rest_time_map', autospec=True,
+            side_effect=calendar_class._get_rest_time_map,
+        ) as rest_time_map:
+            data = self.employee.get_work_days_data(
+                datetime(2019, 6, 3), datetime(2019, 6, 9, 23, 59, 59),
+            )
+        self.assertEqual(data['hours'], 7 * 8.0)
+        self.assertEqual(rest_time_map.call_count, 1)
@@ -2,7 +2,7 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 {
     "name": "Employee Calendar Planning",
-    "version": "12.0.1.0.0",
+    "version": "12.0.1.3.2",
     "category": "Human Resources",
     "website": "https://github.com/OCA/hr",
     "author": "Tecnativa, "
@@ -15,6 +15,8 @@
     "data": [
         "security/ir.model.access.csv",
         "views/hr_employee_views.xml",
+        "views/res_company_views.xml",
+        "wizards/hr_employee_calendar_import_views.xml",
     ],
     "post_init_hook": "post_init_hook",
 }
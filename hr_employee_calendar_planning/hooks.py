@@ -48,13 +48,15 @@ def post_init_hook(cr, registry, employees=None):
             calendar_mapping[calendar].append(
                 (lines[0].date_from, lines[0].date_to, new_calendar),
             )
+        vals_list = []
         for employee in employees:
-            calendar_lines = []
             for data in calendar_mapping[employee.resource_calendar_id]:
-                calendar_lines.append((0, 0, {
+                vals_list.append({
+                    'employee_id': employee.id,
                     'date_start': data[0],
                     'date_end': data[1],
                     'calendar_id': data[2].id,
-                }))
-            employee.calendar_ids = calendar_lines
+                })
+        env['hr.employee.calendar'].create(vals_list)
+        for employee in employees:
             employee.resource_calendar_id.active = False
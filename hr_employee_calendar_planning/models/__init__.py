@@ -1,2 +1,4 @@
 from . import hr_employee
+from . import res_company
 from . import resource_calendar
+from . import resource_calendar_attendance
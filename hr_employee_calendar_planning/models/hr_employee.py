@@ -13,19 +13,12 @@ class HrEmployee(models.Model):
         string="Calendar planning",
     )
 
-    def _regenerate_calendar(self):
+    def _get_calendar_attendance_vals(self):
+        """Return the values of the attendances the auto generated calendar
+        should have, indexed by planning line and source attendance.
+        """
         self.ensure_one()
-        if not self.resource_calendar_id or self.resource_calendar_id.active:
-            self.resource_calendar_id = self.env['resource.calendar'].create({
-                'active': False,
-                'name': _(
-                    'Auto generated calendar for employee'
-                ) + ' %s' % self.name,
-                'attendance_ids': [],
-            }).id
-        else:
-            self.resource_calendar_id.attendance_ids.unlink()
-        vals_list = []
+        res = {}
         for line in self.calendar_ids:
             for attendance_line in line.calendar_id.attendance_ids:
                 data = attendance_line.copy_data({
@@ -33,8 +26,133 @@ class HrEmployee(models.Model):
                     'date_from': line.date_start,
                     'date_to': line.date_end,
                 })[0]
-                vals_list.append((0, 0, data))
-        self.resource_calendar_id.attendance_ids = vals_list
+                res[(line.id, attendance_line.id)] = data
+        return res
+
+    def _get_planning_key(self):
+        """Return a key identifying the planning of the employee, the same
+        for all the employees having the same planning lines.
+        """
+        self.ensure_one()
+        return ';'.join(sorted(
+            '%s,%s,%s' % (
+                fields.Date.to_string(line.date_start) or '',
+                fields.Date.to_string(line.date_end) or '',
+                line.calendar_id.id,
+            )
+            for line in self.calendar_ids
+        ))
+
+    def _get_shared_calendar(self, shared_calendars=None):
+        """Return the calendar the employee shares with the other employees
+        having the same planning, when the company resolves the planning
+        from the shared calendars. A planning made of a single line without
+        dates is its working time; any other planning is an auto generated
+        calendar created once for all the employees having this planning.
+
+        :param shared_calendars: dict caching the calendars by planning key
+        """
+        self.ensure_one()
+        calendar_obj = self.env['resource.calendar']
+        lines = self.calendar_ids
+        if not self.company_id.calendar_planning_shared or not lines:
+            return calendar_obj
+        if (len(lines) == 1 and not lines.date_start and
+                not lines.date_end and lines.calendar_id.active):
+            return lines.calendar_id
+        if shared_calendars is None:
+            shared_calendars = {}
+        key = self._get_planning_key()
+        if key not in shared_calendars:
+            calendar = calendar_obj.with_context(active_test=False).search([
+                ('planning_key', '=', key),
+            ], limit=1)
+            if not calendar:
+                calendar = calendar_obj.create({
+                    'active': False,
+                    'name': _(
+                        'Auto generated calendar for planning'
+                    ) + ' %s' % ', '.join(lines.mapped('calendar_id.name')),
+                    'attendance_ids': [],
+                    'planning_key': key,
+                })
+                calendar._generate_planning_attendances()
+            shared_calendars[key] = calendar
+        return shared_calendars[key]
+
+    @api.multi
+    def _regenerate_calendar(self):
+        """Synchronize the auto generated calendar of the employees with
+        their planning, only adding, updating or removing the attendances
+        of the planning lines that have changed. All the creations and
+        removals of the employees are done at once.
+
+        When the company resolves the planning from the shared calendars,
+        the employees having the same planning use the same calendar, so
+        the attendances are copied once per planning instead of once per
+        employee.
+        """
+        attendance_obj = self.env['resource.calendar.attendance']
+        calendar_obj = self.env['resource.calendar'].with_context(
+            active_test=False)
+        to_create = []
+        to_unlink_ids = []
+        shared_calendars = {}
+        for employee in self:
+            calendar = employee.resource_calendar_id
+            shared_calendar = employee._get_shared_calendar(shared_calendars)
+            if shared_calendar:
+                if calendar != shared_calendar:
+                    if calendar.planning_employee_id == employee:
+                        to_unlink_ids += calendar.attendance_ids.ids
+                    employee.resource_calendar_id = shared_calendar
+                continue
+            if not calendar or calendar.active or calendar.planning_key:
+                calendar = calendar_obj.search([
+                    ('planning_employee_id', '=', employee.id),
+                ], limit=1)
+                if not calendar:
+                    calendar = calendar_obj.create({
+                        'active': False,
+                        'name': _(
+                            'Auto generated calendar for employee'
+                        ) + ' %s' % employee.name,
+                        'attendance_ids': [],
+                        'planning_employee_id': employee.id,
+                    })
+                employee.resource_calendar_id = calendar
+            elif calendar.planning_employee_id != employee:
+                calendar.planning_employee_id = employee
+            current = {}
+            for attendance in employee.resource_calendar_id.attendance_ids:
+                key = (
+                    attendance.employee_calendar_id.id,
+                    attendance.source_attendance_id.id,
+                )
+                if not all(key) or key in current:
+                    to_unlink_ids.append(attendance.id)
+                else:
+                    current[key] = attendance
+            expected = employee._get_calendar_attendance_vals()
+            for key, data in expected.items():
+                attendance = current.pop(key, None)
+                if attendance is None:
+                    data.update({
+                        'employee_calendar_id': key[0],
+                        'source_attendance_id': key[1],
+                    })
+                    to_create.append(data)
+                    continue
+                current_data = attendance.copy_data()[0]
+                changes = {
+                    name: value for name, value in data.items()
+                    if current_data.get(name) != value
+                }
+                if changes:
+                    attendance.write(changes)
+            to_unlink_ids += [attendance.id for attendance in current.values()]
+        attendance_obj.browse(to_unlink_ids).unlink()
+        attendance_obj.create(to_create)
 
     def regenerate_calendar(self):
         self._regenerate_calendar()
@@ -67,23 +185,41 @@ class HrEmployeeCalendar(models.Model):
          'Date end should be higher than date start'),
     ]
 
-    @api.model
-    def create(self, vals):
-        record = super(HrEmployeeCalendar, self).create(vals)
-        record.employee_id._regenerate_calendar()
-        return record
+    def _regenerate_employee_calendars(self, employees):
+        """Regenerate the calendars of the employees, unless it is deferred
+        by the caller through the `skip_calendar_regeneration` context key.
+        """
+        if not self.env.context.get('skip_calendar_regeneration'):
+            employees._regenerate_calendar()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super(HrEmployeeCalendar, self).create(vals_list)
+        self._regenerate_employee_calendars(records.mapped('employee_id'))
+        return records
 
     @api.multi
     def write(self, vals):
+        employees = self.mapped('employee_id')
         res = super(HrEmployeeCalendar, self).write(vals)
-        for employee in self.mapped('employee_id'):
-            employee._regenerate_calendar()
+        self._regenerate_employee_calendars(
+            employees | self.mapped('employee_id'))
         return res
 
     @api.multi
     def unlink(self):
         employees = self.mapped('employee_id')
         res = super(HrEmployeeCalendar, self).unlink()
-        for employee in employees:
-            employee._regenerate_calendar()
+        self._regenerate_employee_calendars(employees)
+        return res
+
+    @api.model
+    def load(self, fields, data):
+        """Regenerate each employee calendar only once per import."""
+        res = super(HrEmployeeCalendar, self.with_context(
+            skip_calendar_regeneration=True,
+        )).load(fields, data)
+        if res.get('ids'):
+            employees = self.browse(res['ids']).mapped('employee_id')
+            employees._regenerate_calendar()
         return res
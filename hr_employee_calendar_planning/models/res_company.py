@@ -0,0 +1,25 @@
+# Copyright 2019 Tecnativa - Pedro M. Baeza
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import api, fields, models
+
+
+class ResCompany(models.Model):
+    _inherit = 'res.company'
+
+    calendar_planning_shared = fields.Boolean(
+        string="Resolve Calendar Planning From Shared Calendars",
+        help="If checked, the employees having the same calendar planning "
+             "share the same calendar, instead of an auto generated calendar "
+             "per employee with a copy of the attendances of their planning.",
+    )
+
+    @api.multi
+    def write(self, vals):
+        res = super(ResCompany, self).write(vals)
+        if 'calendar_planning_shared' in vals:
+            self.env['hr.employee'].search([
+                ('company_id', 'in', self.ids),
+                ('calendar_ids', '!=', False),
+            ])._regenerate_calendar()
+        return res
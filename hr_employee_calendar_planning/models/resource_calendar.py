@@ -10,14 +10,73 @@ class ResourceCalendar(models.Model):
     active = fields.Boolean(
         default=True,
     )
+    planning_employee_id = fields.Many2one(
+        comodel_name="hr.employee",
+        string="Planning Employee",
+        readonly=True,
+        help="Employee whose calendar planning is composed in this "
+             "auto generated calendar.",
+    )
+    planning_key = fields.Char(
+        readonly=True,
+        index=True,
+        copy=False,
+        help="Calendar planning composed in this auto generated calendar, "
+             "shared by all the employees having this planning.",
+    )
+
+    @api.model
+    def _parse_planning_key(self, key):
+        """Return the planning of a key as a list of (date start, date end,
+        calendar) tuples.
+        """
+        planning = []
+        for line in key.split(';'):
+            date_start, date_end, calendar_id = line.split(',')
+            planning.append((
+                date_start or False,
+                date_end or False,
+                self.browse(int(calendar_id)),
+            ))
+        return planning
+
+    @api.multi
+    def _generate_planning_attendances(self):
+        """Generate again the attendances of shared auto generated calendars
+        from the calendars of their planning.
+        """
+        self.mapped('attendance_ids').unlink()
+        vals_list = []
+        for calendar in self:
+            planning = self._parse_planning_key(calendar.planning_key)
+            for date_start, date_end, source in planning:
+                for attendance in source.attendance_ids:
+                    vals_list.append(attendance.copy_data({
+                        'calendar_id': calendar.id,
+                        'date_from': date_start,
+                        'date_to': date_end,
+                        'source_attendance_id': attendance.id,
+                    })[0])
+        self.env['resource.calendar.attendance'].create(vals_list)
 
     @api.multi
     def write(self, vals):
         res = super(ResourceCalendar, self).write(vals)
-        for record in self.filtered('active'):
-            calendars = self.env['hr.employee.calendar'].search([
-                ('calendar_id', '=', record.id)
-            ])
-            for employee in calendars.mapped('employee_id'):
-                employee._regenerate_calendar()
+        calendars = self.env['hr.employee.calendar'].search([
+            ('calendar_id', 'in', self.filtered('active').ids)
+        ])
+        # employees directly using a shared calendar have nothing to copy
+        calendars.mapped('employee_id').filtered(
+            lambda x: (x.resource_calendar_id not in self and
+                       not x.resource_calendar_id.planning_key)
+        )._regenerate_calendar()
+        active_ids = set(self.filtered('active').ids)
+        if active_ids:
+            self.with_context(active_test=False).search([
+                ('planning_key', '!=', False),
+            ]).filtered(lambda x: any(
+                calendar.id in active_ids
+                for _start, _end, calendar in
+                self._parse_planning_key(x.planning_key)
+            ))._generate_planning_attendances()
         return res
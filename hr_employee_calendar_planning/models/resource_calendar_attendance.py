@@ -0,0 +1,22 @@
+# Copyright 2019 Tecnativa - Pedro M. Baeza
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import fields, models
+
+
+class ResourceCalendarAttendance(models.Model):
+    _inherit = 'resource.calendar.attendance'
+
+    employee_calendar_id = fields.Many2one(
+        comodel_name="hr.employee.calendar",
+        string="Employee Calendar Planning",
+        ondelete="set null",
+        copy=False,
+        index=True,
+    )
+    source_attendance_id = fields.Many2one(
+        comodel_name="resource.calendar.attendance",
+        string="Source Attendance",
+        ondelete="set null",
+        copy=False,
+    )
@@ -4,6 +4,9 @@
 from odoo.tests import common
 from ..hooks import post_init_hook
 from odoo import fields
+from odoo.exceptions import UserError
+import base64
+from datetime import datetime
 
 
 class TestHrEmployeeCalendarPlanning(common.SavepointCase):
@@ -89,6 +92,161 @@ class TestHrEmployeeCalendarPlanning(common.SavepointCase):
         })
         self.assertEqual(len(calendar.attendance_ids), 6)
 
+    def test_calendar_planning_incremental(self):
+        self.employee.calendar_ids = [
+            (0, 0, {
+                'date_end': '2019-12-31',
+                'calendar_id': self.calendar1.id,
+            }),
+            (0, 0, {
+                'date_start': '2020-01-01',
+                'calendar_id': self.calendar2.id,
+            }),
+        ]
+        calendar = self.employee.resource_calendar_id
+        line1, line2 = self.employee.calendar_ids
+        attendances1 = calendar.attendance_ids.filtered(
+            lambda x: x.employee_calendar_id == line1
+        )
+        attendances2 = calendar.attendance_ids.filtered(
+            lambda x: x.employee_calendar_id == line2
+        )
+        self.assertEqual(len(attendances1), 10)
+        self.assertEqual(len(attendances2), 5)
+        line2.date_start = '2020-02-01'
+        self.assertEqual(calendar.attendance_ids, attendances1 | attendances2)
+        self.assertEqual(
+            set(attendances2.mapped('date_from')),
+            {fields.Date.to_date('2020-02-01')},
+        )
+        self.calendar2.attendance_ids[0].hour_to = 15
+        self.calendar2.write({'name': 'Test calendar 2 modified'})
+        self.assertEqual(calendar.attendance_ids, attendances1 | attendances2)
+        self.assertEqual(
+            sorted(attendances2.mapped('hour_to')), [14, 14, 14, 14, 15],
+        )
+        line2.unlink()
+        self.assertEqual(calendar.attendance_ids, attendances1)
+
+    def test_calendar_planning_shared(self):
+        self.employee.tz = 'UTC'
+        self.employee.company_id.calendar_planning_shared = True
+        self.employee.calendar_ids = [
+            (0, 0, {
+                'calendar_id': self.calendar1.id,
+            }),
+        ]
+        self.assertEqual(self.employee.resource_calendar_id, self.calendar1)
+        self.assertFalse(self.env['resource.calendar'].with_context(
+            active_test=False,
+        ).search([('planning_employee_id', '=', self.employee.id)]))
+        # A dated planning uses a calendar shared by its employees
+        self.employee.calendar_ids.date_end = '2019-12-31'
+        self.employee.calendar_ids = [
+            (0, 0, {
+                'date_start': '2020-01-01',
+                'calendar_id': self.calendar2.id,
+            }),
+        ]
+        calendar = self.employee.resource_calendar_id
+        self.assertFalse(calendar.active)
+        self.assertTrue(calendar.planning_key)
+        self.assertFalse(calendar.planning_employee_id)
+        self.assertEqual(len(calendar.attendance_ids), 15)
+        employee2 = self.env['hr.employee'].create({
+            'name': 'Test employee 2',
+            'calendar_ids': [
+                (0, 0, {
+                    'date_end': '2019-12-31',
+                    'calendar_id': self.calendar1.id,
+                }),
+                (0, 0, {
+                    'date_start': '2020-01-01',
+                    'calendar_id': self.calendar2.id,
+                }),
+            ],
+        })
+        self.assertEqual(employee2.resource_calendar_id, calendar)
+        self.assertEqual(len(calendar.attendance_ids), 15)
+        # From monday 2019-12-30 to friday 2020-01-03
+        data = self.employee.get_work_days_data(
+            datetime(2019, 12, 30), datetime(2020, 1, 3, 23, 59, 59),
+        )
+        self.assertEqual(data['days'], 5)
+        self.assertEqual(data['hours'], 2 * 8 + 3 * 7)
+        # The shared calendar follows the working times of the planning
+        self.calendar2.attendance_ids = [
+            (2, self.calendar2.attendance_ids[:1].id),
+        ]
+        self.assertEqual(len(calendar.attendance_ids), 14)
+        # Back to a single calendar, the shared calendar is left
+        self.employee.calendar_ids.filtered('date_end').unlink()
+        self.employee.calendar_ids.date_start = False
+        self.assertEqual(self.employee.resource_calendar_id, self.calendar2)
+        self.assertEqual(employee2.resource_calendar_id, calendar)
+        self.employee.company_id.calendar_planning_shared = False
+        own_calendar = self.employee.resource_calendar_id
+        self.assertNotEqual(own_calendar, calendar)
+        self.assertEqual(own_calendar.planning_employee_id, self.employee)
+        self.assertEqual(len(own_calendar.attendance_ids), 4)
+
+    def test_calendar_planning_shared_leave(self):
+        if 'hr.leave' not in self.env:
+            self.skipTest('Leave requests are not installed')
+        self.employee.company_id.calendar_planning_shared = True
+        self.employee.calendar_ids = [
+            (0, 0, {
+                'calendar_id': self.calendar1.id,
+            }),
+        ]
+        leave_type = self.env['hr.leave.type'].create({
+            'name': 'Test leave type',
+            'allocation_type': 'no',
+        })
+        # Monday
+        leave = self.env['hr.leave'].new({
+            'employee_id': self.employee.id,
+            'holiday_status_id': leave_type.id,
+            'request_date_from': '2020-01-06',
+            'request_date_to': '2020-01-06',
+        })
+        leave._onchange_request_parameters()
+        self.assertEqual(leave.date_from.date(), datetime(2020, 1, 6).date())
+        self.assertLess(leave.date_from, leave.date_to)
+        self.assertEqual(
+            self.employee.resource_calendar_id.hours_per_day,
+            self.calendar1.hours_per_day,
+        )
+
+    def test_calendar_planning_batch(self):
+        employee2 = self.env['hr.employee'].create({
+            'name': 'Test employee 2',
+            'identification_id': 'TE2',
+        })
+        csv_data = (
+            "employee,calendar,date_start,date_end\n"
+            "Test employee,Test calendar 1,,2019-12-31\n"
+            "Test employee,Test calendar 2,2020-01-01,\n"
+            "TE2,Test calendar 2,2020-01-01,2020-12-31\n"
+        )
+        wizard = self.env['hr.employee.calendar.import'].create({
+            'data_file': base64.b64encode(csv_data.encode()),
+            'chunk_size': 2,
+        })
+        action = wizard.action_import()
+        lines = self.env['hr.employee.calendar'].search(action['domain'])
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(
+            len(self.employee.resource_calendar_id.attendance_ids), 15,
+        )
+        self.assertEqual(
+            len(employee2.resource_calendar_id.attendance_ids), 5,
+        )
+        wizard.data_file = base64.b64encode(
+            b"employee,calendar\nUnknown,Test calendar 1\n")
+        with self.assertRaises(UserError):
+            wizard.action_import()
+
     def test_post_install_hook(self):
         self.employee.resource_calendar_id = self.calendar1.id
         post_init_hook(self.env.cr, self.env.registry, self.employee)
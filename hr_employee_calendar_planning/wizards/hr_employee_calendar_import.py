@@ -0,0 +1,128 @@
+# Copyright 2019 Tecnativa - Pedro M. Baeza
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import base64
+import csv
+import io
+
+from odoo import api, fields, models, _
+from odoo.exceptions import UserError
+from odoo.tools import split_every
+
+
+class HrEmployeeCalendarImport(models.TransientModel):
+    _name = 'hr.employee.calendar.import'
+    _description = 'Import Employee Calendar Planning'
+
+    data_file = fields.Binary(
+        string="CSV File",
+        required=True,
+        help="CSV file with the columns 'employee' (identification number "
+             "or name), 'calendar' (working time name), 'date_start' and "
+             "'date_end' (optional, YYYY-MM-DD format).",
+    )
+    filename = fields.Char()
+    delimiter = fields.Char(
+        default=',',
+        required=True,
+    )
+    chunk_size = fields.Integer(
+        default=500,
+        required=True,
+        help="Number of planning lines created at once.",
+    )
+
+    @api.multi
+    def _read_rows(self):
+        self.ensure_one()
+        content = base64.b64decode(self.data_file).decode('utf-8-sig')
+        reader = csv.DictReader(
+            io.StringIO(content), delimiter=self.delimiter,
+        )
+        missing = {'employee', 'calendar'} - set(reader.fieldnames or [])
+        if missing:
+            raise UserError(_("Missing columns in the file: %s") % ', '.join(
+                sorted(missing)))
+        return list(reader)
+
+    @api.model
+    def _get_employee_mapping(self, values):
+        employees = self.env['hr.employee'].search([
+            '|',
+            ('identification_id', 'in', list(values)),
+            ('name', 'in', list(values)),
+        ])
+        mapping = {employee.name: employee.id for employee in employees}
+        mapping.update({
+            employee.identification_id: employee.id
+            for employee in employees if employee.identification_id
+        })
+        return mapping
+
+    @api.model
+    def _get_calendar_mapping(self, values):
+        calendars = self.env['resource.calendar'].search([
+            ('name', 'in', list(values)),
+        ])
+        return {calendar.name: calendar.id for calendar in calendars}
+
+    @api.multi
+    def _prepare_planning_vals_list(self, rows):
+        employee_mapping = self._get_employee_mapping(
+            {row['employee'] for row in rows})
+        calendar_mapping = self._get_calendar_mapping(
+            {row['calendar'] for row in rows})
+        vals_list = []
+        errors = []
+        for line, row in enumerate(rows, start=2):
+            employee_id = employee_mapping.get(row['employee'])
+            calendar_id = calendar_mapping.get(row['calendar'])
+            if not employee_id:
+                errors.append(_("Line %d: employee '%s' not found.") % (
+                    line, row['employee']))
+            if not calendar_id:
+                errors.append(_("Line %d: working time '%s' not found.") % (
+                    line, row['calendar']))
+            try:
+                date_start = fields.Date.to_date(row.get('date_start') or None)
+                date_end = fields.Date.to_date(row.get('date_end') or None)
+            except ValueError:
+                errors.append(_("Line %d: wrong date format.") % line)
+                continue
+            vals_list.append({
+                'employee_id': employee_id,
+                'calendar_id': calendar_id,
+                'date_start': date_start or False,
+                'date_end': date_end or False,
+            })
+        if errors:
+            raise UserError('\n'.join(errors))
+        return vals_list
+
+    @api.multi
+    def action_import(self):
+        """Create the planning lines by chunks, and regenerate the calendar
+        of each affected employee only once at the end.
+        """
+        self.ensure_one()
+        if self.chunk_size <= 0:
+            raise UserError(_("The chunk size must be positive."))
+        vals_list = self._prepare_planning_vals_list(self._read_rows())
+        planning_obj = self.env['hr.employee.calendar'].with_context(
+            skip_calendar_regeneration=True,
+        )
+        planning_ids = []
+        for chunk in split_every(self.chunk_size, vals_list, list):
+            planning_ids += planning_obj.create(chunk).ids
+        employee_ids = {vals['employee_id'] for vals in vals_list}
+        employee_obj = self.env['hr.employee']
+        for chunk in split_every(self.chunk_size, employee_ids, list):
+            employee_obj.browse(chunk)._regenerate_calendar()
+            employee_obj.invalidate_cache()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Imported Calendar Planning'),
+            'res_model': 'hr.employee.calendar',
+            'view_mode': 'tree',
+            'domain': [('id', 'in', planning_ids)],
+        }
@@ -3,7 +3,7 @@
 
 {
     'name': 'Leave Credit',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.1.1',
     'category': 'Human Resources',
     'website': 'https://github.com/OCA/hr',
     'author':
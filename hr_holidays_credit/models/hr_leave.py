@@ -9,9 +9,7 @@ class HrLeave(models.Model):
 
     @api.constrains('state', 'number_of_days', 'holiday_status_id')
     def _check_holidays(self):
-        uncreditable_requests = self.filtered(
-            lambda holiday: not holiday._is_holiday_credit_allowed()
-        )
+        uncreditable_requests = self - self._get_credit_allowed_requests()
 
         super(HrLeave, uncreditable_requests)._check_holidays()
 
@@ -19,26 +17,28 @@ class HrLeave(models.Model):
     def _is_holiday_credit_allowed(self):
         self.ensure_one()
 
-        leave_type = self.holiday_status_id
+        return bool(self._get_credit_allowed_requests())
 
-        if not leave_type.allow_credit:
-            return False
-
-        if self.employee_id in leave_type.creditable_employee_ids:
-            return True
-
-        if self.employee_id in (
-                leave_type.creditable_employee_category_ids.mapped(
-                    'employee_ids'
-                )):
-            return True
-
-        if self.employee_id in (
-                leave_type.creditable_department_ids.mapped(
-                    'member_ids'
-                )):
-            return True
-
-        return not leave_type.creditable_employee_ids and \
-            not leave_type.creditable_employee_category_ids and \
-            not leave_type.creditable_department_ids
+    @api.multi
+    def _get_credit_allowed_requests(self):
+        """Return the requests allowed to take leave credit, checking the
+        employees of all the requests of a leave type at once."""
+        allowed_requests = self.browse()
+        for leave_type in self.mapped('holiday_status_id'):
+            if not leave_type.allow_credit:
+                continue
+
+            requests = self.filtered(
+                lambda holiday: holiday.holiday_status_id == leave_type
+            )
+            if not leave_type._is_credit_restricted():
+                allowed_requests |= requests
+                continue
+
+            creditable_employees = leave_type._get_creditable_employees(
+                requests.mapped('employee_id')
+            )
+            allowed_requests |= requests.filtered(
+                lambda holiday: holiday.employee_id in creditable_employees
+            )
+        return allowed_requests
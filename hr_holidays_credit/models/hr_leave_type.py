@@ -37,6 +37,40 @@ class HrLeaveType(models.Model):
         ),
     )
 
+    @api.multi
+    def _is_credit_restricted(self):
+        self.ensure_one()
+
+        return bool(
+            self.creditable_employee_ids
+            or self.creditable_employee_category_ids
+            or self.creditable_department_ids
+        )
+
+    @api.multi
+    def _get_creditable_employees(self, employees):
+        """Return the given employees allowed to take credit on this leave
+        type, resolved with a single search instead of reading all the
+        members of the creditable tags and departments."""
+        self.ensure_one()
+
+        if not self.allow_credit or not employees:
+            return employees.browse()
+
+        if not self._is_credit_restricted():
+            return employees
+
+        return employees.browse(employees.sudo().with_context(
+            active_test=False,
+        ).search([
+            ('id', 'in', employees.ids),
+            '|',
+            '|',
+            ('id', 'in', self.creditable_employee_ids.ids),
+            ('category_ids', 'in', self.creditable_employee_category_ids.ids),
+            ('department_id', 'in', self.creditable_department_ids.ids),
+        ]).ids)
+
     @api.multi
     def name_get(self):
         context_employee_id = self._context.get('employee_id')
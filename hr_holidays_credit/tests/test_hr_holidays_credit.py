@@ -2,6 +2,7 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl.html).
 
 from odoo.tests import common
+from unittest import mock
 from odoo.exceptions import ValidationError
 
 import logging
@@ -170,3 +171,87 @@ class TestHrHolidaysCredit(common.TransactionCase):
             employee_id=employee.id,
         ).name_get()[0][1]
         self.assertTrue('used in credit' in name)
+
+    def test_8(self):
+        department = self.SudoDepartment.create({
+            'name': 'Department #8',
+        })
+        category = self.env['hr.employee.category'].sudo().create({
+            'name': 'Tag #8',
+        })
+        employee_1 = self.SudoEmployee.create({
+            'name': 'Employee #8-1',
+            'department_id': department.id,
+        })
+        employee_2 = self.SudoEmployee.create({
+            'name': 'Employee #8-2',
+            'category_ids': [(6, False, [category.id])],
+        })
+        employee_3 = self.SudoEmployee.create({
+            'name': 'Employee #8-3',
+        })
+        leave_type = self.SudoLeaveType.create({
+            'name': 'Leave Type #8',
+            'allocation_type': 'fixed',
+            'allow_credit': True,
+            'creditable_employee_category_ids': [(6, False, [category.id])],
+            'creditable_department_ids': [(6, False, [department.id])],
+        })
+
+        self.assertEqual(
+            leave_type._get_creditable_employees(
+                employee_1 | employee_2 | employee_3
+            ),
+            employee_1 | employee_2,
+        )
+        employee_2.active = False
+        self.assertEqual(
+            leave_type._get_creditable_employees(employee_1 | employee_2),
+            employee_1 | employee_2,
+        )
+        employee_2.active = True
+
+        leaves = self.SudoLeave.create([{
+            'holiday_status_id': leave_type.id,
+            'holiday_type': 'employee',
+            'employee_id': employee.id,
+            'number_of_days': 1,
+        } for employee in (employee_1, employee_2)])
+        self.assertEqual(leaves._get_credit_allowed_requests(), leaves)
+
+        with self.assertRaises(ValidationError):
+            self.SudoLeave.create({
+                'holiday_status_id': leave_type.id,
+                'holiday_type': 'employee',
+                'employee_id': employee_3.id,
+                'number_of_days': 1,
+            })
+
+    def test_9(self):
+        employee = self.SudoEmployee.create({
+            'name': 'Employee #9',
+        })
+        leave_types = self.SudoLeaveType.create([{
+            'name': 'Leave Type #9-%s' % index,
+            'allocation_type': 'fixed',
+            'allow_credit': True,
+        } for index in range(3)])
+        self.SudoLeave.create({
+            'holiday_status_id': leave_types[0].id,
+            'holiday_type': 'employee',
+            'employee_id': employee.id,
+            'number_of_days': 1,
+        })
+
+        LeaveType = type(self.SudoLeaveType)
+        get_days = LeaveType.get_days
+        with mock.patch.object(
+                LeaveType, 'get_days', autospec=True,
+                side_effect=get_days) as mocked_get_days:
+            names = dict(leave_types.with_context(
+                employee_id=employee.id,
+            ).name_get())
+        self.assertEqual(mocked_get_days.call_count, 1)
+        self.assertTrue('used in credit' in names[leave_types[0].id])
+        self.assertTrue('available + credit' in names[leave_types[1].id])
+        self.assertTrue('available + credit' in names[leave_types[2].id])
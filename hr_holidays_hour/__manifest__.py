@@ -7,14 +7,18 @@
     'author': 'Onestein, Odoo Community Association (OCA)',
     'website': 'https://github.com/OCA/hr',
     'category': 'Human Resources',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.3.3',
     'license': 'AGPL-3',
     'depends': [
         'hr_holidays',
     ],
     'data': [
+        'security/ir.model.access.csv',
+        'security/hr_leave_balance_security.xml',
+        'data/ir_cron.xml',
         'views/hr_employee.xml',
         'report/hr_leave_report.xml',
     ],
+    'post_init_hook': 'post_init_hook',
     'installable': True,
 }
@@ -3,3 +3,4 @@
 from . import hr_employee
 from . import hr_leave
 from . import hr_leave_allocation
+from . import hr_leave_balance
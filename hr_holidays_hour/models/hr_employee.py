@@ -9,32 +9,11 @@ class HrEmployee(models.Model):
 
     @api.multi
     def _compute_leaves_count(self):
-        leaves = self.env['hr.leave'].read_group([
-            ('employee_id', 'in', self.ids),
-            ('holiday_status_id.allocation_type', '!=', 'no'),
-            ('state', '=', 'validate')],
-            fields=['number_of_hours', 'employee_id'],
-            groupby=['employee_id']
-        )
-        mapping_leaves = dict(
-            [(leave['employee_id'][0], leave['number_of_hours'])
-             for leave in leaves]
-        )
-        allocations = self.env['hr.leave.allocation'].read_group([
-            ('employee_id', 'in', self.ids),
-            ('holiday_status_id.allocation_type', '!=', 'no'),
-            ('state', '=', 'validate')],
-            fields=['number_of_hours', 'employee_id'],
-            groupby=['employee_id']
-        )
-        mapping_allocations = dict(
-            [(allocation['employee_id'][0], allocation['number_of_hours'])
-             for allocation in allocations]
+        remaining_hours = self.env['hr.leave.balance']._get_remaining_hours(
+            self.ids, ['fixed', 'fixed_allocation'],
         )
         for employee in self:
-            employee.leaves_count = \
-                mapping_allocations.get(employee.id, 0) - \
-                mapping_leaves.get(employee.id, 0)
+            employee.leaves_count = remaining_hours.get(employee.id, 0)
 
     leaves_count = fields.Float(
         'Number of Leaves',
@@ -46,28 +25,6 @@ class HrEmployee(models.Model):
             :returns dict where the key is the employee id, and the value is
             the remain leaves
         """
-        self._cr.execute("""
-            SELECT
-                sum(h.number_of_hours) AS hours,
-                h.employee_id
-            FROM
-                (
-                    SELECT holiday_status_id, number_of_hours,
-                        state, employee_id
-                    FROM hr_leave_allocation
-                    UNION
-                    SELECT holiday_status_id,
-                           (number_of_hours * -1) as number_of_hours,
-                           state,
-                           employee_id
-                    FROM hr_leave
-                ) h
-                join hr_leave_type s ON (s.id=h.holiday_status_id)
-            WHERE
-                h.state='validate' AND
-                (s.allocation_type='fixed' OR
-                 s.allocation_type='fixed_allocation') AND
-                h.employee_id in %s
-            GROUP BY h.employee_id""", (tuple(self.ids),))
-        return dict((row['employee_id'], row['hours'])
-                    for row in self._cr.dictfetchall())
+        return self.env['hr.leave.balance']._get_remaining_hours(
+            self.ids, ['fixed', 'fixed_allocation'],
+        )
@@ -1,8 +1,21 @@
 # Copyright 2017-2019 Onestein (<https://www.onestein.eu>)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from pytz import utc
+
 from odoo import api, fields, models
 from odoo.addons.resource.models.resource import HOURS_PER_DAY
+from odoo.tools import split_every
+
+_logger = logging.getLogger(__name__)
+
+BALANCE_FIELDS = {
+    'state', 'employee_id', 'holiday_status_id', 'number_of_days',
+    'date_from', 'date_to', 'number_of_hours',
+}
 
 
 class HrLeave(models.Model):
@@ -16,12 +29,99 @@ class HrLeave(models.Model):
         help='Number of hours of the leave request according to '
              'your working schedule.')
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        leaves = super().create(vals_list)
+        self.env['hr.leave.balance']._refresh(
+            leaves._get_balance_employees().ids)
+        return leaves
+
+    @api.multi
+    def write(self, values):
+        if not BALANCE_FIELDS & set(values):
+            return super().write(values)
+        employees = self._get_balance_employees()
+        res = super().write(values)
+        employees |= self._get_balance_employees()
+        self.env['hr.leave.balance']._refresh(employees.ids)
+        return res
+
+    @api.multi
+    def unlink(self):
+        employees = self._get_balance_employees()
+        res = super().unlink()
+        self.env['hr.leave.balance']._refresh(employees.ids)
+        return res
+
+    @api.multi
+    def _get_balance_employees(self):
+        return self.filtered(
+            lambda leave: leave.state == 'validate'
+        ).mapped('employee_id')
+
     @api.depends('number_of_days', 'employee_id', 'date_from', 'date_to')
     def _compute_number_of_hours(self):
+        work_hours = self._get_work_hours_by_leave()
         for leave in self:
-            cal = leave.employee_id.resource_calendar_id
-            cal = cal or self.env.user.company_id.resource_calendar_id
-            hours = cal.get_work_hours_count(
-                leave.date_from, leave.date_to)
+            hours = work_hours.get(leave.id)
             hours = hours or (leave.number_of_days * HOURS_PER_DAY)
             leave.number_of_hours = hours
+
+    @api.multi
+    def _get_work_hours_by_leave(self):
+        """Compute the working hours of the leaves, expanding the work
+        intervals once per calendar over the period covering all its leaves.
+
+        :return: dict mapping the leave ids to their number of hours.
+        """
+        company_calendar = self.env.user.company_id.resource_calendar_id
+        leaves_by_calendar = defaultdict(list)
+        for leave in self:
+            if not leave.date_from or not leave.date_to:
+                continue
+            cal = leave.employee_id.resource_calendar_id or company_calendar
+            if cal:
+                leaves_by_calendar[cal].append(leave)
+
+        work_hours = {}
+        for cal, leaves in leaves_by_calendar.items():
+            intervals = list(cal._work_intervals(
+                min(leave.date_from for leave in leaves).replace(tzinfo=utc),
+                max(leave.date_to for leave in leaves).replace(tzinfo=utc),
+            ))
+            starts = [start for start, stop, meta in intervals]
+            for leave in leaves:
+                date_from = leave.date_from.replace(tzinfo=utc)
+                date_to = leave.date_to.replace(tzinfo=utc)
+                hours = 0.0
+                index = max(bisect_left(starts, date_from) - 1, 0)
+                for start, stop, meta in intervals[index:]:
+                    if start >= date_to:
+                        break
+                    start, stop = max(start, date_from), min(stop, date_to)
+                    if start < stop:
+                        hours += (stop - start).total_seconds() / 3600
+                work_hours[leave.id] = hours
+        return work_hours
+
+    @api.model
+    def _recompute_number_of_hours(self, domain=None, chunk_size=1000):
+        """Recompute the duration in hours of the leaves by chunks, e.g.
+        after a change of the working schedules on a large database.
+        """
+        leave_ids = self.search(domain or []).ids
+        field = self._fields['number_of_hours']
+        done = 0
+        for chunk_ids in split_every(chunk_size, leave_ids):
+            leaves = self.browse(chunk_ids)
+            self.env.add_todo(field, leaves)
+            leaves.recompute()
+            self.env['hr.leave.balance']._refresh(
+                leaves._get_balance_employees().ids)
+            leaves.invalidate_cache()
+            done += len(chunk_ids)
+            _logger.info(
+                'Recomputed duration in hours of %s/%s leaves',
+                done,
+                len(leave_ids),
+            )
@@ -4,6 +4,11 @@
 from odoo import api, fields, models
 from odoo.addons.resource.models.resource import HOURS_PER_DAY
 
+BALANCE_FIELDS = {
+    'state', 'employee_id', 'holiday_status_id', 'number_of_days',
+    'number_of_hours',
+}
+
 
 class HrLeaveAllocation(models.Model):
     _inherit = "hr.leave.allocation"
@@ -16,6 +21,36 @@ class HrLeaveAllocation(models.Model):
         help="UX field allowing to see and modify the allocation duration,"
              "computed in hours.")
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        allocations = super().create(vals_list)
+        self.env['hr.leave.balance']._refresh(
+            allocations._get_balance_employees().ids)
+        return allocations
+
+    @api.multi
+    def write(self, values):
+        if not BALANCE_FIELDS & set(values):
+            return super().write(values)
+        employees = self._get_balance_employees()
+        res = super().write(values)
+        employees |= self._get_balance_employees()
+        self.env['hr.leave.balance']._refresh(employees.ids)
+        return res
+
+    @api.multi
+    def unlink(self):
+        employees = self._get_balance_employees()
+        res = super().unlink()
+        self.env['hr.leave.balance']._refresh(employees.ids)
+        return res
+
+    @api.multi
+    def _get_balance_employees(self):
+        return self.filtered(
+            lambda allocation: allocation.state == 'validate'
+        ).mapped('employee_id')
+
     @api.depends('number_of_days', 'employee_id')
     def _compute_number_of_hours(self):
         for allocation in self:
@@ -0,0 +1,91 @@
+# Copyright 2017-2019 Onestein (<https://www.onestein.eu>)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import api, fields, models
+
+
+class HrLeaveBalance(models.Model):
+    _name = 'hr.leave.balance'
+    _description = 'Leave Balance in Hours'
+    _log_access = False
+
+    employee_id = fields.Many2one(
+        'hr.employee', string='Employee',
+        required=True, readonly=True, index=True, ondelete='cascade',
+    )
+    holiday_status_id = fields.Many2one(
+        'hr.leave.type', string='Leave Type',
+        required=True, readonly=True, ondelete='cascade',
+    )
+    allocated_hours = fields.Float(readonly=True)
+    taken_hours = fields.Float(readonly=True)
+
+    _sql_constraints = [
+        ('employee_leave_type_uniq',
+         'unique(employee_id, holiday_status_id)',
+         'The balance of a leave type must be unique per employee.'),
+    ]
+
+    @api.model
+    def _refresh(self, employee_ids=None):
+        """ Recompute the validated hours per leave type of the given
+        employees (all of them when ``employee_ids`` is None) from their
+        allocations and leaves.
+        """
+        cr = self.env.cr
+        if employee_ids is None:
+            where, params = '', ()
+        elif not employee_ids:
+            return
+        else:
+            where = 'AND employee_id IN %s'
+            params = (tuple(employee_ids),)
+        cr.execute(
+            'UPDATE hr_leave_balance SET allocated_hours = 0.0, '
+            'taken_hours = 0.0 WHERE TRUE ' + where, params)
+        cr.execute("""
+            INSERT INTO hr_leave_balance
+                (employee_id, holiday_status_id, allocated_hours, taken_hours)
+            SELECT employee_id, holiday_status_id,
+                sum(allocated_hours), sum(taken_hours)
+            FROM (
+                SELECT employee_id, holiday_status_id,
+                    COALESCE(number_of_hours, 0.0) AS allocated_hours,
+                    0.0 AS taken_hours
+                FROM hr_leave_allocation
+                WHERE state = 'validate' AND employee_id IS NOT NULL
+                """ + where + """
+                UNION ALL
+                SELECT employee_id, holiday_status_id,
+                    0.0 AS allocated_hours,
+                    COALESCE(number_of_hours, 0.0) AS taken_hours
+                FROM hr_leave
+                WHERE state = 'validate' AND employee_id IS NOT NULL
+                """ + where + """
+            ) h
+            GROUP BY employee_id, holiday_status_id
+            ON CONFLICT (employee_id, holiday_status_id) DO UPDATE
+            SET allocated_hours = EXCLUDED.allocated_hours,
+                taken_hours = EXCLUDED.taken_hours""", params * 2)
+        self.invalidate_cache(list(self._fields))
+
+    @api.model
+    def _get_remaining_hours(self, employee_ids, allocation_types):
+        """ Read the remaining hours of the employees from their balances.
+
+        :param allocation_types: allocation types of the leave types taken
+            into account
+        :return: dict mapping the employee ids to their remaining hours
+        """
+        if not employee_ids:
+            return {}
+        self.env.cr.execute("""
+            SELECT b.employee_id,
+                sum(b.allocated_hours - b.taken_hours) AS hours
+            FROM hr_leave_balance b
+            JOIN hr_leave_type s ON (s.id = b.holiday_status_id)
+            WHERE b.employee_id IN %s AND s.allocation_type IN %s
+            GROUP BY b.employee_id""", (
+            tuple(employee_ids), tuple(allocation_types),
+        ))
+        return dict(self.env.cr.fetchall())
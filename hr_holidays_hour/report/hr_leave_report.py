@@ -1,9 +1,13 @@
 # Copyright 2017-2019 Onestein (<https://www.onestein.eu>)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+from collections import OrderedDict
+
 from psycopg2.extensions import AsIs
 
-from odoo import fields, models, tools
+from odoo import api, fields, models, tools
+
+MATERIALIZED_PARAM = 'hr_holidays_hour.leave_report_materialized'
 
 
 class LeaveReport(models.Model):
@@ -11,49 +15,129 @@ class LeaveReport(models.Model):
 
     number_of_hours = fields.Float('Duration (hours)', readonly=True)
 
-    def _leaves_holidays_hour_select(self):
-        return """
-            leaves.number_of_hours,
-            """
+    def _get_core_report_columns(self):
+        """Columns of the view created by the core module, in order."""
+        self._cr.execute("""
+            SELECT attname
+            FROM pg_attribute
+            WHERE attrelid = %s::regclass
+                AND attnum > 0
+                AND NOT attisdropped
+            ORDER BY attnum
+        """, (self._table,))
+        return [row[0] for row in self._cr.fetchall() if row[0] != 'id']
 
-    def _allocation_holidays_hour_select(self):
-        return """
-            allocation.number_of_hours,
-            """
+    def _get_report_column_expressions(self):
+        """Expressions of the columns on the leave allocations and on the
+        leave requests, for the columns not read as is from both tables.
+        """
+        return {
+            'number_of_days': (
+                'allocation.number_of_days',
+                'request.number_of_days * -1'),
+            'number_of_hours': (
+                'allocation.number_of_hours',
+                'request.number_of_hours * -1'),
+            'date_from': ('null::timestamp', 'request.date_from'),
+            'date_to': ('null::timestamp', 'request.date_to'),
+            'payslip_status': ('FALSE', 'request.payslip_status'),
+            'type': ("'allocation'::varchar", "'request'::varchar"),
+        }
 
-    def _request_holidays_hour_select(self):
+    def _get_report_columns(self):
+        """Columns of the report, the ones of the core view and the hours,
+        each with its expression on the leave allocations and on the leave
+        requests.
+        """
+        expressions = self._get_report_column_expressions()
+        return OrderedDict(
+            (name, expressions.get(name, (
+                'allocation.%s' % name, 'request.%s' % name)))
+            for name in self._get_core_report_columns() + ['number_of_hours']
+        )
+
+    def _get_report_query(self):
+        columns = self._get_report_columns()
         return """
-            request.number_of_hours * '-1'::integer::double precision AS
-                number_of_hours,
-            """
+            SELECT
+                row_number() OVER (ORDER BY leaves.employee_id) AS id,
+                {columns}
+            FROM (
+                SELECT {allocation_columns}
+                FROM hr_leave_allocation AS allocation
+                UNION ALL
+                SELECT {request_columns}
+                FROM hr_leave AS request
+            ) leaves
+        """.format(
+            columns=', '.join(
+                'leaves.{0} AS {0}'.format(name) for name in columns
+            ),
+            allocation_columns=', '.join(
+                '{} AS {}'.format(expressions[0], name)
+                for name, expressions in columns.items()
+            ),
+            request_columns=', '.join(
+                '{} AS {}'.format(expressions[1], name)
+                for name, expressions in columns.items()
+            ),
+        )
+
+    def _get_materialized_table(self):
+        """Relation holding the report data when it is materialized. The
+        report view itself stays a plain view reading from it, so that the
+        core module can still drop and recreate it on update.
+        """
+        return '%s_materialized' % self._table
 
+    @api.model
+    def _is_report_materialized(self):
+        value = self.env['ir.config_parameter'].sudo().get_param(
+            MATERIALIZED_PARAM, 'False')
+        return value.strip() in ('1', 'True', 'true')
+
+    @api.model_cr
     def init(self):
-        """Inject parts in the query with this hack, fetching the query and
-        recreating it. Query is returned all in upper case and with final ';'.
+        """Recreate the view of the core module with its columns and the
+        hours, reading from a materialized view with indexes when enabled by
+        the system parameter.
         """
         super().init()
         cr = self._cr
-        cr.execute("SELECT pg_get_viewdef(%s, true)", (self._table,))
-        view_def = cr.fetchone()[0]
-        view_def = view_def.replace(
-            "leaves.number_of_days",
-            "{} leaves.number_of_days".format(
-                self._leaves_holidays_hour_select()),
-        )
-        view_def = view_def.replace(
-            "allocation.number_of_days",
-            "{} allocation.number_of_days".format(
-                self._allocation_holidays_hour_select()),
-        )
-        view_def = view_def.replace(
-            "request.number_of_days",
-            "{} request.number_of_days".format(
-                self._request_holidays_hour_select()),
-        )
-        if view_def[-1] == ';':
-            view_def = view_def[:-1]
+        view_def = self._get_report_query()
+        materialized_table = self._get_materialized_table()
         # Re-create view
         tools.drop_view_if_exists(cr, self._table)
-        cr.execute('create or replace view %s as (%s)', (
-            AsIs(self._table), AsIs(view_def),
+        cr.execute('DROP MATERIALIZED VIEW IF EXISTS %s', (
+            AsIs(materialized_table),
+        ))
+        if not self._is_report_materialized():
+            cr.execute('create or replace view %s as (%s)', (
+                AsIs(self._table), AsIs(view_def),
+            ))
+            return
+
+        cr.execute('CREATE MATERIALIZED VIEW %s AS (%s)', (
+            AsIs(materialized_table), AsIs(view_def),
+        ))
+        cr.execute('CREATE UNIQUE INDEX %s_id_idx ON %s (id)', (
+            AsIs(materialized_table), AsIs(materialized_table),
+        ))
+        for column in ('employee_id', 'holiday_status_id', 'date_from'):
+            cr.execute('CREATE INDEX %s_%s_idx ON %s (%s)', (
+                AsIs(materialized_table), AsIs(column),
+                AsIs(materialized_table), AsIs(column),
+            ))
+        cr.execute('create or replace view %s as (SELECT * FROM %s)', (
+            AsIs(self._table), AsIs(materialized_table),
+        ))
+
+    @api.model
+    def _refresh_report(self):
+        """Refresh the materialized report, without locking its readers."""
+        if not self._is_report_materialized():
+            return
+        self._cr.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY %s', (
+            AsIs(self._get_materialized_table()),
         ))
+        self.invalidate_cache()
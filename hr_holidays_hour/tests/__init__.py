@@ -2,3 +2,4 @@
 
 from . import test_leave_hours
 from . import test_hr_holidays
+from . import test_leave_report
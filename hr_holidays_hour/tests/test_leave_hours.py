@@ -123,3 +123,76 @@ class TestLeaveHours(common.TransactionCase):
         self.assertEqual(self.employee_2.remaining_leaves, 80.0)
         self.assertEqual(self.employee_3.remaining_leaves, 80.0)
         self.assertEqual(self.employee_4.remaining_leaves, 0.0)
+
+    def test_number_of_hours_batch(self):
+        leaves = self.leave_1 | self.leave_2
+        for leave in leaves:
+            cal = leave.employee_id.resource_calendar_id
+            self.assertEqual(
+                leave.number_of_hours,
+                cal.get_work_hours_count(leave.date_from, leave.date_to),
+            )
+
+        hours = self.leave_1.number_of_hours
+        self.calendar.attendance_ids.write({'hour_to': 12.0})
+        self.env['hr.leave']._recompute_number_of_hours(
+            domain=[('id', 'in', leaves.ids)],
+            chunk_size=1,
+        )
+        for leave in leaves:
+            cal = leave.employee_id.resource_calendar_id
+            self.assertEqual(
+                leave.number_of_hours,
+                cal.get_work_hours_count(leave.date_from, leave.date_to),
+            )
+        self.assertLess(self.leave_1.number_of_hours, hours)
+
+    def test_leave_balance(self):
+        leave_2b = self.env['hr.leave'].create({
+            'holiday_status_id': self.leave_type_2.id,
+            'holiday_type': 'employee',
+            'date_from': self.holiday_start + relativedelta(days=7),
+            'date_to': self.holiday_end + relativedelta(days=7),
+            'employee_id': self.employee_2.id,
+        })
+        leaves = self.leave_2 | leave_2b
+        leaves.action_approve()
+        self.assertEqual(leaves.mapped('state'), ['validate', 'validate'])
+
+        balance = self.env['hr.leave.balance'].search([
+            ('employee_id', '=', self.employee_2.id),
+            ('holiday_status_id', '=', self.leave_type_2.id),
+        ])
+        self.assertEqual(
+            balance.allocated_hours,
+            self.leave_allocation_2.number_of_hours,
+        )
+        self.assertEqual(
+            balance.taken_hours,
+            sum(leaves.mapped('number_of_hours')),
+        )
+        self.assertEqual(
+            self.employee_2._get_remaining_leaves()[self.employee_2.id],
+            balance.allocated_hours - balance.taken_hours,
+        )
+
+        leave_2b.action_refuse()
+        self.assertEqual(
+            balance.taken_hours,
+            self.leave_2.number_of_hours,
+        )
+
+    def test_leave_balance_access(self):
+        user = self.env['res.users'].create({
+            'name': 'Balance User',
+            'login': 'balance_user',
+            'groups_id': [(6, 0, [self.env.ref('base.group_user').id])],
+        })
+        self.employee_1.user_id = user
+        balances = self.env['hr.leave.balance'].sudo(user).search([])
+        self.assertEqual(balances.mapped('employee_id'), self.employee_1)
+
+        self.employee_2.parent_id = self.employee_1
+        balances = self.env['hr.leave.balance'].sudo(user).search([])
+        self.assertEqual(
+            balances.mapped('employee_id'), self.employee_1 | self.employee_2)
@@ -0,0 +1,87 @@
+# Copyright 2017-2019 Onestein (<https://www.onestein.eu>)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from datetime import datetime
+
+from odoo import tools
+from odoo.tests import common
+
+
+class TestLeaveReport(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+
+        self.LeaveReport = self.env['hr.leave.report']
+        self.employee = self.env['hr.employee'].create({
+            'name': 'Employee Report',
+        })
+        self.leave_type = self.env['hr.leave.type'].create({
+            'name': 'Leave Type Report',
+            'allocation_type': 'fixed',
+            'request_unit': 'hour',
+        })
+        allocation = self.env['hr.leave.allocation'].create({
+            'name': 'Allocation Report',
+            'holiday_status_id': self.leave_type.id,
+            'holiday_type': 'employee',
+            'employee_id': self.employee.id,
+            'number_of_days': 10,
+        })
+        allocation.action_approve()
+
+    def _get_report_hours(self):
+        groups = self.LeaveReport.read_group(
+            [('employee_id', '=', self.employee.id)],
+            ['number_of_hours'],
+            ['employee_id'],
+        )
+        return groups[0]['number_of_hours']
+
+    def test_report_view(self):
+        columns = self.LeaveReport._get_report_columns()
+        for name, field in self.LeaveReport._fields.items():
+            if field.store and name != 'id':
+                self.assertIn(name, columns)
+        hours = self._get_report_hours()
+        self.assertTrue(hours)
+
+        self.env['hr.leave'].create({
+            'holiday_status_id': self.leave_type.id,
+            'holiday_type': 'employee',
+            'date_from': datetime(2019, 6, 4, 8, 0),
+            'date_to': datetime(2019, 6, 4, 18, 0),
+            'employee_id': self.employee.id,
+        })
+        self.assertLess(self._get_report_hours(), hours)
+
+    def test_report_materialized(self):
+        self.env['ir.config_parameter'].sudo().set_param(
+            'hr_holidays_hour.leave_report_materialized', 'True')
+        self.LeaveReport.init()
+        hours = self._get_report_hours()
+
+        leave = self.env['hr.leave'].create({
+            'holiday_status_id': self.leave_type.id,
+            'holiday_type': 'employee',
+            'date_from': datetime(2019, 6, 4, 8, 0),
+            'date_to': datetime(2019, 6, 4, 18, 0),
+            'employee_id': self.employee.id,
+        })
+        self.assertEqual(self._get_report_hours(), hours)
+
+        self.LeaveReport._refresh_report()
+        self.assertEqual(
+            self._get_report_hours(), hours - leave.number_of_hours)
+
+        # the core module drops and recreates the view on update
+        tools.drop_view_if_exists(self.env.cr, self.LeaveReport._table)
+        self.LeaveReport.init()
+        self.assertEqual(
+            self._get_report_hours(), hours - leave.number_of_hours)
+
+        self.env['ir.config_parameter'].sudo().set_param(
+            'hr_holidays_hour.leave_report_materialized', 'False')
+        self.assertFalse(self.LeaveReport._is_report_materialized())
+        self.LeaveReport.init()
+        self.assertEqual(
+            self._get_report_hours(), hours - leave.number_of_hours)
@@ -3,7 +3,7 @@
 
 {
     'name': 'Auto Approve Leaves',
-    'version': '12.0.2.0.1',
+    'version': '12.0.2.2.1',
     'license': 'AGPL-3',
     'summary': 'Leave type for auto-validation of Leaves',
     'author': 'Onestein, Odoo Community Association (OCA)',
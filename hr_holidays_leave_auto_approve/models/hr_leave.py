@@ -15,35 +15,99 @@ class HrLeave(models.Model):
     @api.multi
     def _should_auto_approve(self):
         self.ensure_one()
-        policy = self.holiday_status_id.auto_approve_policy
-        return (self.can_approve and policy == 'hr') or policy == 'all'
+        return bool(self._get_auto_approve_leaves())
+
+    @api.multi
+    def _get_auto_approve_leaves(self):
+        """Return the leaves to auto approve, evaluating the policy once per
+        leave type."""
+        leaves = self.browse()
+        for leave_type in self.mapped('holiday_status_id'):
+            policy = leave_type.auto_approve_policy
+            if policy == 'no':
+                continue
+            type_leaves = self.filtered(
+                lambda r: r.holiday_status_id == leave_type
+            )
+            if policy == 'hr':
+                type_leaves = type_leaves.filtered('can_approve')
+            leaves |= type_leaves
+        return leaves
 
     @api.multi
     def _apply_auto_approve_policy(self):
-        self.filtered(
-            lambda r: r._should_auto_approve()
-        ).sudo().action_approve()
+        leaves = self._get_auto_approve_leaves()
+        if leaves:
+            leaves.sudo().with_context(
+                tracking_disable=True,
+                mail_activity_automation_skip=True,
+            ).action_approve()
 
-    @api.model
-    def create(self, values):
-        auto_approve = self._get_auto_approve_on_creation(values)
+    @api.model_create_multi
+    def create(self, vals_list):
         tracking_disable = self.env.context.get('tracking_disable')
         mail_skip = self.env.context.get('mail_activity_automation_skip')
-        ctx = self.env.context.copy()
-        ctx.update({
-            'tracking_disable': tracking_disable or auto_approve,
-            'mail_activity_automation_skip': mail_skip or auto_approve,
-        })
-        res = super(HrLeave, self.with_context(ctx)).create(values)
-        res._apply_auto_approve_policy()
+        auto_approve_by_type = self._get_auto_approve_by_leave_type(
+            [values.get('holiday_status_id') for values in vals_list]
+        )
+        indexes_by_auto_approve = {True: [], False: []}
+        for index, values in enumerate(vals_list):
+            auto_approve = auto_approve_by_type.get(
+                values.get('holiday_status_id'), False
+            )
+            indexes_by_auto_approve[auto_approve].append(index)
+        ids = [None] * len(vals_list)
+        for auto_approve, indexes in indexes_by_auto_approve.items():
+            if not indexes:
+                continue
+            ctx = self.env.context.copy()
+            ctx.update({
+                'tracking_disable': tracking_disable or auto_approve,
+                'mail_activity_automation_skip': mail_skip or auto_approve,
+            })
+            records = super(HrLeave, self.with_context(ctx)).create(
+                [vals_list[index] for index in indexes]
+            )
+            for index, record_id in zip(indexes, records.ids):
+                ids[index] = record_id
+        res = self.browse(ids)
+        deferred_ids = self.env.context.get('auto_approve_defer')
+        if deferred_ids is not None:
+            deferred_ids.extend(res.ids)
+        else:
+            res._apply_auto_approve_policy()
         return res
 
+    @api.model
+    def load(self, fields, data):
+        """Auto approve the leaves created by the import all at once, after
+        the whole import instead of after each of its batches. This includes
+        the leaves created along with the imported ones."""
+        deferred_ids = []
+        result = super(
+            HrLeave, self.with_context(auto_approve_defer=deferred_ids)
+        ).load(fields, data)
+        # leaves of the batches in error have been rolled back
+        leaves = self.browse(deferred_ids).exists()
+        if leaves:
+            leaves._apply_auto_approve_policy()
+        return result
+
+    @api.model
+    def _get_auto_approve_by_leave_type(self, leave_type_ids):
+        """Map the given leave type ids to whether their leaves are auto
+        approved, reading the leave types at once."""
+        leave_types = self.env['hr.leave.type'].browse(
+            list({leave_type_id for leave_type_id in leave_type_ids
+                  if leave_type_id})
+        )
+        return {
+            leave_type.id: leave_type.auto_approve_policy != 'no'
+            for leave_type in leave_types
+        }
+
     @api.model
     def _get_auto_approve_on_creation(self, values):
-        auto_approve = False
-        if values.get('holiday_status_id'):
-            leave_type = self.env['hr.leave.type'].browse(
-                values.get('holiday_status_id')
-            )
-            auto_approve = leave_type.auto_approve_policy != 'no'
-        return auto_approve
+        return self._get_auto_approve_by_leave_type(
+            [values.get('holiday_status_id')]
+        ).get(values.get('holiday_status_id'), False)
@@ -2,6 +2,7 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
 from datetime import datetime, timedelta
+from odoo import fields
 from odoo.tests.common import TransactionCase
 
 
@@ -150,3 +151,71 @@ class TestHolidaysAutoValidate(TransactionCase):
 
         # Check for leave2 state
         self.assertEqual(leave2.state, 'validate')
+
+    def test_leave_requests_batch(self):
+        self.leave_allocation2.action_approve()
+        today = datetime.today()
+        leaves = self.leave_request_model.create([{
+            'name': 'Test Leave Request %s' % index,
+            'holiday_status_id': leave_type.id,
+            'date_from': today + timedelta(days=3 * index),
+            'date_to': today + timedelta(days=3 * index + 1),
+            'holiday_type': 'employee',
+            'employee_id': self.test_employee_id.id,
+        } for index, leave_type in enumerate([
+            self.test_leave_type2_id,
+            self.test_leave_type1_id,
+            self.test_leave_type2_id,
+        ])])
+        self.assertEqual(leaves[0].holiday_status_id, self.test_leave_type2_id)
+        self.assertEqual(leaves[1].holiday_status_id, self.test_leave_type1_id)
+        self.assertEqual(
+            leaves.mapped('state'), ['confirm', 'validate', 'confirm'],
+        )
+
+    def test_leave_requests_import(self):
+        self.leave_allocation2.action_approve()
+        today = datetime.today()
+        result = self.leave_request_model.load([
+            'name',
+            'holiday_status_id/.id',
+            'holiday_type',
+            'employee_id/.id',
+            'date_from',
+            'date_to',
+        ], [[
+            'Test Leave Import %s' % index,
+            str(leave_type.id),
+            'employee',
+            str(self.test_employee_id.id),
+            fields.Datetime.to_string(today + timedelta(days=3 * index)),
+            fields.Datetime.to_string(
+                today + timedelta(days=3 * index + 1)),
+        ] for index, leave_type in enumerate([
+            self.test_leave_type1_id,
+            self.test_leave_type2_id,
+            self.test_leave_type1_id,
+        ])])
+        self.assertFalse(result['messages'])
+        leaves = self.leave_request_model.browse(result['ids'])
+        self.assertEqual(
+            leaves.mapped('state'), ['validate', 'confirm', 'validate'],
+        )
+
+    def test_leave_requests_deferred(self):
+        self.leave_allocation2.action_approve()
+        today = datetime.today()
+        deferred_ids = []
+        leave = self.leave_request_model.with_context(
+            auto_approve_defer=deferred_ids,
+        ).create({
+            'name': 'Test Leave Deferred',
+            'holiday_status_id': self.test_leave_type1_id.id,
+            'date_from': today,
+            'date_to': today + timedelta(days=1),
+            'holiday_type': 'employee',
+            'employee_id': self.test_employee_id.id,
+        })
+        # leaves created during an import are approved after it
+        self.assertEqual(deferred_ids, leave.ids)
+        self.assertEqual(leave.state, 'confirm')
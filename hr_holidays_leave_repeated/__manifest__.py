@@ -7,7 +7,7 @@
     'author': 'Onestein, Odoo Community Association (OCA)',
     'website': 'https://github.com/OCA/hr/',
     'category': 'Human Resources',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.3.0',
     'license': 'AGPL-3',
     'depends': [
         'hr_holidays',
@@ -2,6 +2,7 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
 from dateutil.relativedelta import relativedelta
+from pytz import utc
 
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError, ValidationError
@@ -25,19 +26,100 @@ class HrLeave(models.Model):
     repeat_end_date = fields.Date(default=lambda self: fields.Date.today())
 
     @api.model
-    def _update_repeated_workday_dates(self, employee, from_dt, to_dt, days):
+    def _get_repeated_calendar(self, vals, employee):
+        """Calendar used to find the working slots of a repeated leave.
+
+        Public holidays are taken into account like for the duration of the
+        leave when hr_holidays_public is installed.
+        """
+        calendar = employee.resource_calendar_id.with_context(
+            employee_id=employee.id)
+        leave_type = self.env['hr.leave.type'].browse(
+            vals.get('holiday_status_id'))
+        if 'exclude_public_holidays' in leave_type._fields and (
+                leave_type.exclude_public_holidays or not leave_type):
+            calendar = calendar.with_context(exclude_public_holidays=True)
+        return calendar
+
+    @api.model
+    def _get_workday_index(self, calendar, start_dt, end_dt, index=None):
+        """Index the working time of the calendar by UTC date, evaluating
+        attendances, leaves and public holidays once for the whole period.
+        An existing ``index`` is extended up to ``end_dt``.
+
+        :return: dict with the ``calendar``, the ``end`` of the indexed
+                 period and the ``days`` mapping each date to its available
+                 work ``hours``, its ``attendances`` and its ``work``
+                 intervals (attendances minus leaves).
+        """
+        if index is None:
+            index = {'calendar': calendar, 'end': start_dt, 'days': {}}
+        start_dt = index['end'].replace(tzinfo=utc)
+        attendances = index['calendar']._attendance_intervals(
+            start_dt, end_dt.replace(tzinfo=utc))
+        leaves = index['calendar']._leave_intervals(
+            start_dt, end_dt.replace(tzinfo=utc))
+        for key, intervals in (('attendances', attendances),
+                               ('work', attendances - leaves)):
+            for start, stop, meta in intervals:
+                day = index['days'].setdefault(
+                    start.astimezone(utc).date(),
+                    {'hours': 0.0, 'attendances': [], 'work': []})
+                day[key].append((start, stop))
+                if key == 'work':
+                    day['hours'] += (stop - start).total_seconds() / 3600
+        index['end'] = end_dt
+        return index
+
+    @api.model
+    def _get_workday_index_hours(self, index, from_dt, to_dt, key='work'):
+        """Look up the work hours between two naive UTC datetimes.
+
+        Intervals starting the day before ``from_dt`` are included, as an
+        attendance can span midnight in UTC.
+        """
+        from_dt = from_dt.replace(tzinfo=utc)
+        to_dt = to_dt.replace(tzinfo=utc)
+        day = from_dt.date() - relativedelta(days=1)
+        hours = 0.0
+        while day <= to_dt.date():
+            values = index['days'].get(day)
+            day += relativedelta(days=1)
+            if not values or (key == 'work' and not values['hours']):
+                continue
+            for start, stop in values[key]:
+                start = max(start, from_dt)
+                stop = min(stop, to_dt)
+                if start < stop:
+                    hours += (stop - start).total_seconds() / 3600
+        return hours
+
+    @api.model
+    def _update_repeated_workday_dates(self, employee, from_dt, to_dt, days,
+                                       index=None):
         user = self.env.user
-        calendar = employee.resource_calendar_id
+        span = relativedelta(days=max(days, 7))
+        if index is None:
+            index = self._get_workday_index(
+                employee.resource_calendar_id, from_dt, to_dt + span)
         orig_from_dt = fields.Datetime.context_timestamp(user, from_dt)
         orig_to_dt = fields.Datetime.context_timestamp(user, to_dt)
-        work_hours = calendar.get_work_hours_count(
-            from_dt, to_dt, compute_leaves=False)
+        work_hours = self._get_workday_index_hours(
+            index, from_dt, to_dt, key='attendances')
+        limit_dt = from_dt + relativedelta(years=1)
         while work_hours:
             from_dt = from_dt + relativedelta(days=days)
             to_dt = to_dt + relativedelta(days=days)
-
-            new_work_hours = calendar.get_work_hours_count(
-                from_dt, to_dt, compute_leaves=True)
+            if from_dt > limit_dt:
+                raise UserError(_(
+                    'No working time found for the repetition of the '
+                    'leave request within one year.'))
+            if to_dt > index['end']:
+                self._get_workday_index(
+                    index['calendar'], from_dt, to_dt + span, index=index)
+
+            new_work_hours = self._get_workday_index_hours(
+                index, from_dt, to_dt)
             if new_work_hours and work_hours <= new_work_hours:
                 break
 
@@ -80,7 +162,7 @@ class HrLeave(models.Model):
         }
 
     @api.model
-    def _update_repeated_leave_vals(self, vals, employee):
+    def _update_repeated_leave_vals(self, vals, employee, index=None):
         vals_dict = self._get_repeated_vals_dict()
         param_dict = vals_dict[vals.get('repeat_every')]
         from_dt = fields.Datetime.from_string(vals.get('date_from'))
@@ -91,7 +173,7 @@ class HrLeave(models.Model):
             raise UserError(param_dict['user_error_msg'])
 
         from_dt, to_dt = self._update_repeated_workday_dates(
-            employee, from_dt, to_dt, param_dict['days'])
+            employee, from_dt, to_dt, param_dict['days'], index=index)
 
         vals['request_date_from'] = vals['date_from'] = from_dt
         vals['request_date_to'] = vals['date_to'] = to_dt
@@ -99,7 +181,20 @@ class HrLeave(models.Model):
         return vals
 
     @api.model
-    def create_repeated_handler(self, vals, employee):
+    def _get_repeated_window_end(self, vals):
+        """Estimate the end of the repeat window, so that the calendar can
+        be evaluated once for all the occurrences."""
+        days = self._get_repeated_vals_dict()[vals['repeat_every']]['days']
+        to_dt = fields.Datetime.from_string(vals.get('date_to'))
+        if vals.get('repeat_mode', 'times') == 'date':
+            end_dt = fields.Datetime.from_string(vals.get('repeat_end_date'))
+            return max(end_dt or to_dt, to_dt) + relativedelta(days=days)
+        repeat_limit = max(vals.get('repeat_limit', 0), 0)
+        return to_dt + relativedelta(days=days * (repeat_limit + 1))
+
+    @api.model
+    def _get_repeated_leave_vals_list(self, vals, employee):
+        """Compute all the occurrences of a repeated leave request."""
         def _check_repeating(count, vals):
             repeat_mode = vals.get('repeat_mode', 'times')
             if repeat_mode == 'times' and count < vals.get('repeat_limit', 0):
@@ -109,19 +204,34 @@ class HrLeave(models.Model):
                 return True
             return False
 
+        index = self._get_workday_index(
+            self._get_repeated_calendar(vals, employee),
+            fields.Datetime.from_string(vals.get('date_from')),
+            self._get_repeated_window_end(vals))
+        vals_list = []
         count = 1
-        vals = self._update_repeated_leave_vals(vals, employee)
+        vals = self._update_repeated_leave_vals(
+            dict(vals), employee, index=index)
         while _check_repeating(count, vals):
-            self.with_context(skip_create_handler=True).create(vals)
+            vals_list.append(vals)
             count += 1
-            vals = self._update_repeated_leave_vals(vals, employee)
+            vals = self._update_repeated_leave_vals(
+                dict(vals), employee, index=index)
+        return vals_list
 
     @api.model
-    def create(self, vals):
-        res = super().create(vals)
-        skip_create_handler = self.env.context.get('skip_create_handler')
-        all_vals_set = vals.get('repeat_every') and vals.get('repeat_mode')
-        if not skip_create_handler and all_vals_set:
+    def create_repeated_handler(self, vals, employee):
+        vals_list = self._get_repeated_leave_vals_list(vals, employee)
+        return self.with_context(skip_create_handler=True).create(vals_list)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        if self.env.context.get('skip_create_handler'):
+            return res
+        for vals in vals_list:
+            if not (vals.get('repeat_every') and vals.get('repeat_mode')):
+                continue
             employee = self.env['hr.employee'].browse(vals.get('employee_id'))
             if employee.resource_calendar_id:
                 self.create_repeated_handler(vals, employee)
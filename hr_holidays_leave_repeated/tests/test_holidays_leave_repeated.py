@@ -1,7 +1,7 @@
 # Copyright 2016-2019 Onestein (<https://www.onestein.eu>)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from odoo.tests import common
 from odoo.exceptions import ValidationError, UserError
 
@@ -232,3 +232,79 @@ class TestHolidaysLeaveRepeated(common.TransactionCase):
                 'date_to': date_end,
                 'employee_id': self.employee_5.id,
             })
+
+    def test_10_workdays_beyond_window(self):
+        calendar = self.env['resource.calendar'].create({
+            'name': 'Calendar 2',
+            'attendance_ids': [(0, 0, {
+                'name': 'Day ' + str(i),
+                'dayofweek': str(i),
+                'hour_from': 8.0,
+                'hour_to': 16.0,
+            }) for i in range(0, 5)],
+        })
+        employee = self.env['hr.employee'].create({
+            'name': 'Employee 6',
+            'resource_calendar_id': calendar.id,
+        })
+        date_start = datetime(2019, 3, 4, 8, 0, 0, 0)
+        date_end = datetime(2019, 3, 4, 16, 0, 0, 0)
+        self.env['hr.leave'].create({
+            'holiday_status_id': self.status_1.id,
+            'holiday_type': 'employee',
+            'repeat_every': 'workday',
+            'repeat_mode': 'times',
+            'repeat_limit': 30,
+            'date_from': date_start,
+            'date_to': date_end,
+            'employee_id': employee.id,
+        })
+        leaves = self.env['hr.leave'].search([
+            ('holiday_status_id', '=', self.status_1.id),
+            ('employee_id', '=', employee.id),
+        ])
+        self.assertEqual(len(leaves), 30)
+        self.assertFalse(leaves.filtered(
+            lambda leave: leave.date_from.weekday() >= 5))
+        self.assertEqual(
+            max(leaves.mapped('date_from')).date(), date(2019, 4, 12))
+
+    def test_11_workdays_skip_global_leave(self):
+        calendar = self.env['resource.calendar'].create({
+            'name': 'Calendar 3',
+            'tz': 'UTC',
+            'attendance_ids': [(0, 0, {
+                'name': 'Day ' + str(i),
+                'dayofweek': str(i),
+                'hour_from': 8.0,
+                'hour_to': 18.0,
+            }) for i in range(0, 7)],
+        })
+        self.env['resource.calendar.leaves'].create({
+            'name': 'Closed',
+            'calendar_id': calendar.id,
+            'date_from': datetime(2019, 5, 2, 0, 0, 0),
+            'date_to': datetime(2019, 5, 2, 23, 59, 59),
+        })
+        employee = self.env['hr.employee'].create({
+            'name': 'Employee 7',
+            'resource_calendar_id': calendar.id,
+        })
+        self.env['hr.leave'].create({
+            'holiday_status_id': self.status_1.id,
+            'holiday_type': 'employee',
+            'repeat_every': 'workday',
+            'repeat_mode': 'times',
+            'repeat_limit': 3,
+            'date_from': datetime(2019, 5, 1, 8, 0, 0),
+            'date_to': datetime(2019, 5, 1, 18, 0, 0),
+            'employee_id': employee.id,
+        })
+        leaves = self.env['hr.leave'].search([
+            ('holiday_status_id', '=', self.status_1.id),
+            ('employee_id', '=', employee.id),
+        ])
+        self.assertEqual(
+            sorted(leaves.mapped('date_from')),
+            [datetime(2019, 5, 1, 8, 0), datetime(2019, 5, 3, 8, 0),
+             datetime(2019, 5, 4, 8, 0)])
@@ -3,7 +3,7 @@
 
 {
     'name': 'Leave Request Wizard',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.2.1',
     'category': 'Human Resources',
     'website': 'https://github.com/OCA/hr',
     'author':
@@ -17,7 +17,11 @@
         'hr_holidays',
     ],
     'data': [
+        'views/assets.xml',
         'views/hr_leave.xml',
         'wizards/hr_leave_wizard.xml',
     ],
+    'qweb': [
+        'static/src/xml/leave_wizard_grid.xml',
+    ],
 }
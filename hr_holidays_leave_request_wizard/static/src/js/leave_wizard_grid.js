@@ -0,0 +1,150 @@
+/* Copyright 2018-2019 Brainbean Apps (https://brainbeanapps.com)
+ * License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl). */
+odoo.define('hr_holidays_leave_request_wizard.leave_wizard_grid', function (require) {
+    "use strict";
+
+    var AbstractField = require('web.AbstractField');
+    var core = require('web.core');
+    var field_registry = require('web.field_registry');
+    var field_utils = require('web.field_utils');
+
+    var qweb = core.qweb;
+    var _t = core._t;
+
+    /**
+     * Editable table of the compact grid of the leave request wizard.
+     *
+     * The grid is a JSON list of [date, since, until, available hours,
+     * requested hours] rows. Requests are edited by interval in hours, or
+     * by day in days, depending on the request unit of the leave type. The
+     * rounding is done by the server when the grid changes.
+     */
+    var LeaveWizardGrid = AbstractField.extend({
+        className: 'o_leave_wizard_grid',
+        supportedFieldTypes: ['text'],
+        // the lines depend on the request unit of the leave type
+        resetOnAnyFieldChange: true,
+        events: _.extend({}, AbstractField.prototype.events, {
+            'change input.o_leave_wizard_grid_requested': '_onRequestedChange',
+        }),
+
+        /**
+         * @private
+         * @returns {Array} rows of the grid, empty if it is not valid
+         */
+        _getRows: function () {
+            var rows;
+            try {
+                rows = JSON.parse(this.value || '[]');
+            } catch (error) {
+                return [];
+            }
+            return _.isArray(rows) ? rows : [];
+        },
+        /**
+         * @private
+         * @returns {String} 'day' or 'hour'
+         */
+        _getRequestUnit: function () {
+            return this.record.data.leave_type_request_unit === 'day' ?
+                'day' : 'hour';
+        },
+        /**
+         * @private
+         * @param {Array} rows
+         * @returns {Array} one line per row in hours, or per date in days
+         */
+        _getLines: function (rows) {
+            var formatFloat = field_utils.format.float;
+            if (this._getRequestUnit() === 'hour') {
+                return _.map(rows, function (row, index) {
+                    return {
+                        indexes: [index],
+                        date: moment(row[0]).format('ddd ll'),
+                        interval: _.str.sprintf(
+                            '%s - %s',
+                            moment.utc(row[1]).local().format('HH:mm'),
+                            moment.utc(row[2]).local().format('HH:mm')),
+                        available: formatFloat(row[3]),
+                        requested: formatFloat(row[4]),
+                    };
+                });
+            }
+            var lines = [];
+            var line_by_date = {};
+            _.each(rows, function (row, index) {
+                var line = line_by_date[row[0]];
+                if (!line) {
+                    line = line_by_date[row[0]] = {
+                        indexes: [],
+                        date: moment(row[0]).format('ddd ll'),
+                        interval: '',
+                        available_hours: 0.0,
+                        requested_hours: 0.0,
+                    };
+                    lines.push(line);
+                }
+                line.indexes.push(index);
+                line.available_hours += row[3];
+                line.requested_hours += row[4];
+            });
+            _.each(lines, function (line) {
+                var available = line.available_hours > 0.0;
+                line.available = formatFloat(available ? 1.0 : 0.0);
+                line.requested = formatFloat(available ?
+                    line.requested_hours / line.available_hours : 0.0);
+            });
+            return lines;
+        },
+        /**
+         * @override
+         * @private
+         */
+        _render: function () {
+            this.$el.html(qweb.render('LeaveWizardGrid', {
+                lines: this._getLines(this._getRows()),
+                unit: this._getRequestUnit(),
+                readonly: this.mode === 'readonly',
+            }));
+        },
+        /**
+         * Store the requested amount of an edited line in the grid; the
+         * requested hours of a day are given to its intervals in order.
+         *
+         * @private
+         * @param {jQueryEvent} ev
+         */
+        _onRequestedChange: function (ev) {
+            var $input = $(ev.currentTarget);
+            var value;
+            try {
+                value = field_utils.parse.float($input.val());
+            } catch (error) {
+                this.do_warn(_t('Invalid value'), $input.val());
+                this._render();
+                return;
+            }
+            var rows = this._getRows();
+            var indexes = _.map(
+                String($input.data('indexes')).split(','), Number);
+            if (this._getRequestUnit() === 'hour') {
+                rows[indexes[0]][4] = value;
+            } else {
+                var available = _.reduce(indexes, function (total, index) {
+                    return total + rows[index][3];
+                }, 0.0);
+                var requested = available * value;
+                _.each(indexes, function (index) {
+                    var cell = Math.max(Math.min(requested, rows[index][3]), 0.0);
+                    rows[index][4] = cell;
+                    requested -= cell;
+                });
+            }
+            this._setValue(JSON.stringify(rows));
+        },
+    });
+
+    field_registry.add('leave_wizard_grid', LeaveWizardGrid);
+
+    return LeaveWizardGrid;
+});
@@ -1,10 +1,12 @@
 # Copyright 2018-2019 Brainbean Apps (https://brainbeanapps.com)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl.html).
 
+import json
 from pytz import timezone, UTC
 from datetime import datetime, date
 
 from odoo import fields
+from odoo.exceptions import UserError
 
 from odoo.tests import common
 
@@ -464,3 +466,168 @@ class TestHrHolidaysLeaveRequestWizard(common.TransactionCase):
         self.assertEqual(wizard.date_from, wizard.date_to)
         wizard.day_ids._compute_name()
         wizard.interval_ids._compute_name()
+
+    def test_9(self):
+        leave_type = self.SudoLeaveType.create({
+            'name': 'Leave Type #9',
+            'allocation_type': 'fixed',
+            'validity_start': False,
+            'request_unit': 'hour',
+        })
+        employee = self.SudoEmployee.create({
+            'name': 'Employee #9',
+            'tz': 'America/Los_Angeles',
+        })
+
+        wizard = self.Wizard.create({
+            'name': 'test_9',
+            'employee_id': employee.id,
+            'leave_type_id': leave_type.id,
+            'date_from': date(2019, 4, 1),
+            'date_to': date(2019, 6, 30),
+        })
+        wizard._onchange_employee_id()
+        self.assertEqual(len(wizard.day_ids), 91)
+
+        HrLeaveWizardDay = self.env['hr.leave.wizard.day']
+        intervals_by_date = HrLeaveWizardDay._get_intervals_by_date(
+            employee,
+            date(2019, 4, 1),
+            date(2019, 6, 30),
+        )
+        for day in wizard.day_ids:
+            self.assertEqual(
+                intervals_by_date[day.date],
+                HrLeaveWizardDay._get_intervals_by_date(
+                    employee,
+                    day.date,
+                    day.date,
+                )[day.date],
+            )
+            self.assertEqual(
+                len(day.interval_ids),
+                len(intervals_by_date[day.date]),
+            )
+
+    def test_10(self):
+        leave_type = self.SudoLeaveType.create({
+            'name': 'Leave Type #10',
+            'allocation_type': 'fixed',
+            'validity_start': False,
+            'request_unit': 'hour',
+        })
+        employee = self.SudoEmployee.create({
+            'name': 'Employee #10',
+        })
+        self.SudoLeaveAllocation.create({
+            'holiday_type': 'employee',
+            'employee_id': employee.id,
+            'holiday_status_id': leave_type.id,
+            'state': 'validate',
+            'number_of_days': 10.0,
+        })
+
+        wizard = self.Wizard.create({
+            'name': 'test_10',
+            'employee_id': employee.id,
+            'leave_type_id': leave_type.id,
+            'date_from': date(2019, 4, 1),
+            'date_to': date(2019, 4, 7),
+            'compact_mode': True,
+        })
+        wizard._onchange_employee_id()
+        self.assertFalse(wizard.day_ids)
+        rows = json.loads(wizard.grid)
+        self.assertEqual(len(rows), 10)
+
+        requested = [0.0, 0.0, 3.9, 0.0, 8.0, 4.0, 4.0, 0.0, 4.0, 4.0]
+        for row, hours in zip(rows, requested):
+            row[4] = hours
+        wizard.grid = json.dumps(rows)
+        wizard._onchange_grid()
+        rows = json.loads(wizard.grid)
+        self.assertEqual(rows[2][4], 4.0)
+        self.assertEqual(rows[4][4], 4.0)
+
+        leaves = wizard.generate_leaves()
+        self.assertEqual(len(leaves), 3)
+        self.assertEqual(
+            leaves.filtered(
+                lambda leave: leave.name == 'test_10 (1/3)'
+            ).number_of_days,
+            0.5,
+        )
+        self.assertEqual(
+            leaves.filtered(
+                lambda leave: leave.name == 'test_10 (2/3)'
+            ).number_of_days,
+            1.5,
+        )
+        self.assertEqual(
+            leaves.filtered(
+                lambda leave: leave.name == 'test_10 (3/3)'
+            ).number_of_days,
+            1.0,
+        )
+
+    def test_11(self):
+        leave_type = self.SudoLeaveType.create({
+            'name': 'Leave Type #11',
+            'allocation_type': 'fixed',
+            'validity_start': False,
+            'request_unit': 'day',
+        })
+        employee = self.SudoEmployee.create({
+            'name': 'Employee #11',
+        })
+        self.SudoLeaveAllocation.create({
+            'holiday_type': 'employee',
+            'employee_id': employee.id,
+            'holiday_status_id': leave_type.id,
+            'state': 'validate',
+            'number_of_days': 10.0,
+        })
+
+        wizard = self.Wizard.create({
+            'name': 'test_11',
+            'employee_id': employee.id,
+            'leave_type_id': leave_type.id,
+            'date_from': date(2019, 4, 1),
+            'date_to': date(2019, 4, 2),
+            'compact_mode': True,
+        })
+        wizard._onchange_employee_id()
+        rows = json.loads(wizard.grid)
+        self.assertEqual(len(rows), 4)
+
+        for grid in ['{', '{}', '[[1, 2]]', '[["2019-04-01", 1, 2, 3, 4]]']:
+            wizard.grid = grid
+            with self.assertRaises(UserError):
+                wizard._onchange_grid()
+        row = rows[0][:4] + ['4']
+        wizard.grid = json.dumps([row] + rows[1:])
+        with self.assertRaises(UserError):
+            wizard._onchange_grid()
+
+        # Requested days are rounded by quarters of day and spread over the
+        # intervals of the day in order
+        rows[0][4] = 0.0
+        rows[1][4] = 3.0
+        wizard.grid = json.dumps(rows)
+        wizard._onchange_grid()
+        rows = json.loads(wizard.grid)
+        self.assertEqual([row[4] for row in rows], [4.0, 0.0, 4.0, 4.0])
+
+        # Only the days with changed cells are recomputed
+        rows[3][4] = 1.0
+        wizard.grid_snapshot = json.dumps(rows)
+        rows[0][4] = 0.0
+        wizard.grid = json.dumps(rows)
+        wizard._onchange_grid()
+        rows = json.loads(wizard.grid)
+        self.assertEqual([row[4] for row in rows], [0.0, 0.0, 4.0, 1.0])
+
+        # The whole grid is normalized when generating the leaves
+        leaves = wizard.generate_leaves()
+        self.assertEqual(len(leaves), 1)
+        self.assertEqual(leaves.number_of_days, 0.75)
@@ -2,7 +2,10 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
 import babel.dates
+import json
+from collections import defaultdict
 from datetime import datetime, time
+from functools import reduce
 from dateutil.relativedelta import relativedelta
 from pytz import timezone, utc
 
@@ -54,6 +57,22 @@ class HrLeaveWizard(models.TransientModel):
         comodel_name='hr.leave.wizard.day.interval',
         inverse_name='wizard_id',
     )
+    compact_mode = fields.Boolean(
+        string='Compact Mode',
+        help='Exchange the days and intervals as a single serialized grid '
+             'instead of the Days and Intervals lines.',
+    )
+    grid = fields.Text(
+        string='Grid',
+        help='JSON list of [date, since, until, available hours, '
+             'requested hours] rows, one per interval, used in compact '
+             'mode.',
+    )
+    grid_snapshot = fields.Text(
+        string='Normalized Grid',
+        help='Grid as last normalized, used to only recompute the days '
+             'whose cells have changed.',
+    )
 
     def _default_employee_id(self):
         return self.env.context.get('default_employee_id') or \
@@ -77,12 +96,39 @@ class HrLeaveWizard(models.TransientModel):
     @api.multi
     @api.onchange('leave_type_id')
     def _onchange_leave_type_id(self):
-        self._generate_days()
+        # NOTE: Days and intervals do not depend on the leave type
+        for wizard in self:
+            if not (wizard.grid if wizard.compact_mode else wizard.day_ids):
+                wizard._generate_days()
+
+    @api.multi
+    @api.onchange('grid')
+    def _onchange_grid(self):
+        for wizard in self.filtered('compact_mode'):
+            rows = wizard._get_grid_rows()
+            normalized_rows = wizard._normalize_grid_rows(
+                rows,
+                wizard.leave_type_request_unit,
+                json.loads(wizard.grid_snapshot or '[]'),
+            )
+            values = {'grid_snapshot': json.dumps(normalized_rows)}
+            if normalized_rows != rows:
+                values['grid'] = values['grid_snapshot']
+            wizard.update(values)
 
     @api.multi
     def _generate_days(self):
         HrLeaveWizardDay = self.env['hr.leave.wizard.day']
         for wizard in self:
+            if wizard.compact_mode:
+                grid = json.dumps(wizard._generate_grid_rows())
+                wizard.update({
+                    'day_ids': [(5, 0, 0)],
+                    'interval_ids': [(5, 0, 0)],
+                    'grid': grid,
+                    'grid_snapshot': grid,
+                })
+                continue
             day_ids = HrLeaveWizardDay
             date = wizard.date_from
             while date <= wizard.date_to:
@@ -97,6 +143,226 @@ class HrLeaveWizard(models.TransientModel):
             wizard.day_ids._generate_intervals()
             wizard.interval_ids = wizard.day_ids.mapped('interval_ids')
 
+    @api.multi
+    def _prepare_lines_hr_leave_values(self):
+        self.ensure_one()
+        if self.leave_type_request_unit == 'day':
+            self.day_ids._recompute_request_amount_downward()
+        elif self.leave_type_request_unit == 'hour':
+            self.day_ids._recompute_request_amount_upward()
+        else:  # pragma: no cover
+            raise UserError(_(
+                'Unknown leave type request unit: %s'
+            ) % (
+                self.leave_type_request_unit,
+            ))
+
+        values = []
+        cells = [
+            (interval.requested_hours, interval.available_hours, interval)
+            for interval in self.interval_ids
+        ]
+        for group in self._group_requested_cells(cells):
+            interval = reduce(lambda a, b: a | b, group)
+            values.append(
+                interval._prepare_hr_leave_values()
+                if len(interval) == 1
+                else interval._prepare_merged_hr_leave_values()
+            )
+        return values
+
+    @api.multi
+    def _generate_grid_rows(self):
+        self.ensure_one()
+        if not self.employee_id.resource_id:  # pragma: no cover
+            return []
+        intervals_by_date = self.env[
+            'hr.leave.wizard.day'
+        ]._get_intervals_by_date(
+            self.employee_id,
+            self.date_from,
+            self.date_to,
+        )
+        rows = []
+        for date in sorted(intervals_by_date):
+            for since, until in intervals_by_date[date]:
+                available_hours = (until - since).total_seconds() / 3600
+                rows.append([
+                    fields.Date.to_string(date),
+                    fields.Datetime.to_string(since),
+                    fields.Datetime.to_string(until),
+                    available_hours,
+                    available_hours,
+                ])
+        return rows
+
+    @api.multi
+    def _get_grid_rows(self):
+        self.ensure_one()
+        try:
+            rows = json.loads(self.grid or '[]')
+        except ValueError:
+            rows = None
+        if not isinstance(rows, list):
+            raise UserError(_(
+                'The grid must be a JSON list of rows.'
+            ))
+        for number, row in enumerate(rows, 1):
+            self._check_grid_row(number, row)
+        return rows
+
+    @api.model
+    def _check_grid_row(self, number, row):
+        if not isinstance(row, list) or len(row) != 5:
+            raise UserError(_(
+                'Row %s of the grid must be a list of 5 values: date, '
+                'since, until, available hours and requested hours.'
+            ) % number)
+        date, since, until, available, requested = row
+        try:
+            if not all(isinstance(value, str) for value in row[:3]):
+                raise ValueError()
+            fields.Date.to_date(date)
+            if fields.Datetime.to_datetime(since) > \
+                    fields.Datetime.to_datetime(until):
+                raise ValueError()
+        except ValueError:
+            raise UserError(_(
+                'Row %s of the grid has an invalid date or interval.'
+            ) % number)
+        if not all(
+            isinstance(value, (int, float)) and
+            not isinstance(value, bool) and value >= 0.0
+            for value in (available, requested)
+        ):
+            raise UserError(_(
+                'Row %s of the grid has invalid hours.'
+            ) % number)
+
+    @api.model
+    def _normalize_grid_rows(self, rows, request_unit, previous_rows=None):
+        """ Round the requested hours of the cells the same way the lines
+        do: by quarters of the interval in hours, or by quarters of the day
+        in days, the requested hours of a day being then spread over its
+        intervals in order.
+
+        :param previous_rows: rows as last normalized, the days whose cells
+            are all unchanged are not recomputed
+        """
+        previous_rows = {
+            tuple(row[:3]): row for row in previous_rows or []
+        }
+        rows_by_date = defaultdict(list)
+        for row in rows:
+            rows_by_date[row[0]].append(row)
+        normalized_rows = {}
+        for date, day_rows in rows_by_date.items():
+            if previous_rows and all(
+                previous_rows.get(tuple(row[:3])) == row for row in day_rows
+            ):
+                continue
+            if request_unit == 'day':
+                normalized_rows.update(self._normalize_grid_day(day_rows))
+                continue
+            for row in day_rows:
+                date, since, until, available, requested = row
+                amount = (float_utils.round(
+                    ROUNDING_FACTOR * requested / available
+                ) / ROUNDING_FACTOR) if available else 0.0
+                amount = max(min(amount, 1.0), 0.0)
+                normalized_rows[id(row)] = [
+                    date, since, until, available, available * amount,
+                ]
+        return [normalized_rows.get(id(row), row) for row in rows]
+
+    @api.model
+    def _normalize_grid_day(self, day_rows):
+        """ Round the requested hours of a day to quarters of the day and
+        spread them over its intervals, as the days lines do.
+
+        :return: dict {id(row): normalized row}
+        """
+        available = sum(row[3] for row in day_rows)
+        requested = sum(row[4] for row in day_rows)
+        amount = (float_utils.round(
+            ROUNDING_FACTOR * requested / available
+        ) / ROUNDING_FACTOR) if available else 0.0
+        requested = available * max(min(amount, 1.0), 0.0)
+        normalized_rows = {}
+        for row in day_rows:
+            cell_requested = max(min(requested, row[3]), 0.0)
+            normalized_rows[id(row)] = row[:4] + [cell_requested]
+            requested -= cell_requested
+        return normalized_rows
+
+    @api.multi
+    def _prepare_grid_hr_leave_values(self):
+        self.ensure_one()
+        rows = self._normalize_grid_rows(
+            self._get_grid_rows(),
+            self.leave_type_request_unit,
+        )
+        day_available_hours = defaultdict(float)
+        for date, since, until, available, requested in rows:
+            day_available_hours[date] += available
+        cells = []
+        for date, since, until, available, requested in rows:
+            available_days = (float_utils.round(
+                ROUNDING_FACTOR * available / day_available_hours[date]
+            ) / ROUNDING_FACTOR) if day_available_hours[date] else 0.0
+            requested_days = available_days * (
+                requested / available if available else 0.0
+            )
+            cells.append((requested, available, {
+                'since': fields.Datetime.to_datetime(since),
+                'until': fields.Datetime.to_datetime(until),
+                'requested_hours': requested,
+                'requested_days': requested_days,
+            }))
+        values = []
+        for group in self._group_requested_cells(cells):
+            values.append({
+                'employee_id': self.employee_id.id,
+                'holiday_status_id': self.leave_type_id.id,
+                'number_of_days': sum(
+                    cell['requested_days'] for cell in group
+                ),
+                'date_from': group[0]['since'],
+                'date_to': group[-1]['until'] if len(group) > 1 else min(
+                    group[0]['until'],
+                    group[0]['since'] + relativedelta(
+                        hours=group[0]['requested_hours']
+                    ),
+                ),
+            })
+        return values
+
+    @api.model
+    def _group_requested_cells(self, cells):
+        """ Group the requested cells into leave requests: a fully requested
+        cell is merged with the following requested ones.
+
+        :param cells: list of (requested hours, available hours, payload)
+        :return: list of lists of payloads
+        """
+        groups = []
+        index = 0
+        while index < len(cells):
+            requested, available, payload = cells[index]
+            group = [payload]
+            if requested > 0.0:
+                if requested >= available and available > 0.0:
+                    while index + len(group) < len(cells):
+                        other_requested, dummy, other_payload = cells[
+                            index + len(group)
+                        ]
+                        if other_requested <= 0.0:
+                            break
+                        group.append(other_payload)
+                groups.append(group)
+            index += len(group)
+        return groups
+
     @api.model
     def default_get(self, fields_list):
         defaults = super().default_get(fields_list)
@@ -121,37 +387,10 @@ class HrLeaveWizard(models.TransientModel):
     def generate_leaves(self):
         leave_requests = []
         for wizard in self:
-            if wizard.leave_type_request_unit == 'day':
-                wizard.day_ids._recompute_request_amount_downward()
-            elif wizard.leave_type_request_unit == 'hour':
-                wizard.day_ids._recompute_request_amount_upward()
-            else:  # pragma: no cover
-                raise UserError(_(
-                    'Unknown leave type request unit: %s'
-                ) % (
-                    wizard.leave_type_request_unit,
-                ))
-
-            draft_leave_requests = []
-            index = 0
-            while index < len(wizard.interval_ids):
-                interval = wizard.interval_ids[index]
-                if interval.requested_hours > 0.0:
-                    if interval.requested_hours >= interval.available_hours \
-                            and interval.available_hours > 0.0:
-                        while index + len(interval) < len(wizard.interval_ids):
-                            other_interval = wizard.interval_ids[
-                                index + len(interval)
-                            ]
-                            if other_interval.requested_hours <= 0.0:
-                                break
-                            interval |= other_interval
-                    draft_leave_requests.append(
-                        interval._prepare_hr_leave_values()
-                        if len(interval) == 1
-                        else interval._prepare_merged_hr_leave_values()
-                    )
-                index += len(interval)
+            if wizard.compact_mode:
+                draft_leave_requests = wizard._prepare_grid_hr_leave_values()
+            else:
+                draft_leave_requests = wizard._prepare_lines_hr_leave_values()
 
             for index, draft_leave_request in enumerate(draft_leave_requests):
                 draft_leave_request.update({
@@ -246,45 +485,74 @@ class HrLeaveWizardDay(models.TransientModel):
     @api.multi
     def _generate_intervals(self):
         HrLeaveWizardDayInterval = self.env['hr.leave.wizard.day.interval']
+        days_by_employee = defaultdict(list)
         for day in self:
-            employee = day.wizard_id.employee_id
+            days_by_employee[day.wizard_id.employee_id].append(day)
+        for employee, days in days_by_employee.items():
             if not employee.resource_id:  # pragma: no cover
-                day.interval_ids = [(5, 0, 0)]
+                for day in days:
+                    day.interval_ids = [(5, 0, 0)]
                 continue
 
-            day_start = datetime.combine(day.date, time.min)
-            day_end = datetime.combine(day.date, time.max)
-            day_start = day_start.replace(tzinfo=utc)
-            day_end = day_end.replace(tzinfo=utc)
-
-            calendar = employee.resource_calendar_id
-            attendance_intervals = calendar._attendance_intervals(
-                day_start,
-                day_end,
-                employee.resource_id,
-            )
-            unpaid_intervals = calendar._leave_intervals(
-                day_start,
-                day_end,
-                employee.resource_id,
-            )
-            global_intervals = calendar._leave_intervals(
-                day_start,
-                day_end,
-                None,
-            )
-            intervals = (
-                attendance_intervals - (unpaid_intervals - global_intervals)
+            intervals_by_date = self._get_intervals_by_date(
+                employee,
+                min(day.date for day in days),
+                max(day.date for day in days),
             )
+            for day in days:
+                interval_ids = [(5, 0, 0)]
+                for since, until in intervals_by_date[day.date]:
+                    values = HrLeaveWizardDayInterval._prepare_values(
+                        since,
+                        until,
+                    )
+                    interval_ids += [(0, 0, values)]
+                day.interval_ids = interval_ids
+
+    @api.model
+    def _get_intervals_by_date(self, employee, date_from, date_to):
+        """ Compute the work intervals of the employee once for the whole
+        date range, and split them by (UTC) day.
+
+        :return: dict {date: [(since, until)]} of naive UTC datetimes
+        """
+        range_start = datetime.combine(date_from, time.min)
+        range_end = datetime.combine(date_to, time.max)
+        range_start = range_start.replace(tzinfo=utc)
+        range_end = range_end.replace(tzinfo=utc)
+
+        calendar = employee.resource_calendar_id
+        attendance_intervals = calendar._attendance_intervals(
+            range_start,
+            range_end,
+            employee.resource_id,
+        )
+        unpaid_intervals = calendar._leave_intervals(
+            range_start,
+            range_end,
+            employee.resource_id,
+        )
+        global_intervals = calendar._leave_intervals(
+            range_start,
+            range_end,
+            None,
+        )
+        intervals = (
+            attendance_intervals - (unpaid_intervals - global_intervals)
+        )
 
-            interval_ids = [(5, 0, 0)]
-            for start, stop, meta in intervals:
-                values = HrLeaveWizardDayInterval._prepare_values(
-                    start.astimezone(utc).replace(tzinfo=None),
-                    stop.astimezone(utc).replace(tzinfo=None),
+        intervals_by_date = defaultdict(list)
+        for start, stop, meta in intervals:
+            since = start.astimezone(utc).replace(tzinfo=None)
+            stop = stop.astimezone(utc).replace(tzinfo=None)
+            while since < stop:
+                until = min(stop, datetime.combine(since.date(), time.max))
+                intervals_by_date[since.date()].append((since, until))
+                since = datetime.combine(
+                    since.date() + relativedelta(days=1),
+                    time.min,
                 )
-                interval_ids += [(0, 0, values)]
-            day.interval_ids = interval_ids
+        return intervals_by_date
 
     @api.multi
     def _recompute_request_amount_upward(self):
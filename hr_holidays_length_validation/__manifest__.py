@@ -3,7 +3,7 @@
 
 {
     'name': 'Leaves: length validation',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.1.2',
     'category': 'Human Resources',
     'website': 'https://github.com/OCA/hr',
     'author':
@@ -15,8 +15,10 @@
     'summary': 'Leave\'s length validation',
     'depends': [
         'hr_holidays',
+        'resource_hook',
     ],
     'data': [
+        'data/ir_cron.xml',
         'views/hr_leave.xml',
     ],
 }
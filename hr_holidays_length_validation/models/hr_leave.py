@@ -1,13 +1,37 @@
 # Copyright 2019 Brainbean Apps (https://brainbeanapps.com)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
-from odoo import models, api, _
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from pytz import timezone, utc
+
+from odoo import models, fields, api, _
+from odoo.addons.resource.models.resource_mixin import ROUNDING_FACTOR
 from odoo.exceptions import UserError
+from odoo.tools import float_utils
+
+_logger = logging.getLogger(__name__)
 
 
 class HrLeave(models.Model):
     _inherit = 'hr.leave'
 
+    length_outdated = fields.Boolean(
+        string='Outdated Length',
+        readonly=True,
+        copy=False,
+        help='Set by the scheduled length validation when the length of the'
+             ' leave no longer matches the resource calendar.',
+    )
+
+    @api.multi
+    def write(self, values):
+        if 'length_outdated' not in values and (
+                {'date_from', 'date_to', 'number_of_days'} & set(values)):
+            values = dict(values, length_outdated=False)
+        return super().write(values)
+
     @api.multi
     def _validate_length(self):
         self.ensure_one()
@@ -15,22 +39,98 @@ class HrLeave(models.Model):
         if not self.employee_id:  # pragma: no cover
             return False
 
-        recomputed_number_of_days = self.employee_id.get_work_days_data(
-            self.date_from,
-            self.date_to,
+        return bool(self._get_outdated_length_leaves())
+
+    @api.multi
+    def _get_recomputed_number_of_days(self):
+        """Recompute the length in days of the leaves, expanding the calendar
+        intervals once per employee instead of once per leave.
+
+        :return: dict mapping the leave ids to their recomputed length.
+        """
+        leaves_by_employee = defaultdict(lambda: self.browse())
+        for leave in self.filtered('employee_id'):
+            leaves_by_employee[leave.employee_id] |= leave
+
+        result = {}
+        for employee, leaves in leaves_by_employee.items():
+            result.update(
+                leaves._get_employee_recomputed_number_of_days(employee))
+        return result
+
+    @api.multi
+    def _get_employee_recomputed_number_of_days(self, employee):
+        """Same computation as ``get_work_days_data`` of resource_hook, the
+        hours being counted through the hooks of the employee, but from a
+        single expansion of the calendar for all the leaves.
+        """
+        resource = employee.resource_id
+        calendar = employee.resource_calendar_id
+        tz = timezone((resource or calendar).tz)
+        from_datetime = min(self.mapped('date_from')).replace(tzinfo=utc)
+        to_datetime = max(self.mapped('date_to')).replace(tzinfo=utc)
+
+        # Leaves of an employee can not overlap each other: excluding all of
+        # them at once is the same as excluding each one from its own length
+        intervals = list(calendar._attendance_intervals(
+            from_datetime,
+            to_datetime,
+            resource,
+        ) - calendar._leave_intervals(
+            from_datetime,
+            to_datetime,
+            resource,
             domain=[
                 ('time_type', '=', 'leave'),
                 '|',
-                ('holiday_id', '!=', self.id),
+                ('holiday_id', 'not in', self.ids),
                 ('holiday_id', '=', False),
             ],
-        )['days']
+        ))
 
-        return self.number_of_days != recomputed_number_of_days
+        starts = [start for start, stop, meta in intervals]
+        day_total = {}
+        result = {}
+        for leave in self:
+            date_from = leave.date_from.replace(tzinfo=utc).astimezone(tz)
+            date_to = leave.date_to.replace(tzinfo=utc).astimezone(tz)
+            index = max(bisect_left(starts, date_from) - 1, 0)
+            leave_intervals = []
+            for start, stop, meta in intervals[index:]:
+                if start >= date_to:
+                    break
+                start, stop = max(start, date_from), min(stop, date_to)
+                if start < stop:
+                    leave_intervals.append((start, stop, meta))
+            work_hours = employee._get_intervals_work_hours(
+                calendar, leave_intervals)
+            day_hours = defaultdict(float)
+            for (start, stop, meta), hours in zip(
+                    leave_intervals, work_hours):
+                day_hours[start.date()] += hours
+            for day in day_hours:
+                if day not in day_total:
+                    day_total[day] = employee._get_template_day_hours(
+                        calendar, day)
+            result[leave.id] = sum(
+                float_utils.round(
+                    ROUNDING_FACTOR * day_hours[day] / day_total[day]
+                ) / ROUNDING_FACTOR
+                for day in day_hours
+            )
+        return result
+
+    @api.multi
+    def _get_outdated_length_leaves(self):
+        number_of_days = self._get_recomputed_number_of_days()
+        return self.filtered(
+            lambda leave: leave.id in number_of_days
+            and leave.number_of_days != number_of_days[leave.id]
+        )
 
     @api.multi
     def action_validate_length(self):
-        outdated = self.filtered(lambda x: x._validate_length())
+        outdated = self._get_outdated_length_leaves()
         if outdated:
             raise UserError(_(
                 'Following leaves have outdated length:\n\t %s'
@@ -45,3 +145,33 @@ class HrLeave(models.Model):
                     outdated
                 ))),
             ))
+
+    @api.model
+    def _cron_validate_length(self, limit=1000):
+        """Validate the length of the leaves by batches of ``limit``, resuming
+        after the last leave checked by the previous run, and flag the ones
+        that drifted from the resource calendar."""
+        param = 'hr_holidays_length_validation.last_leave_id'
+        config = self.env['ir.config_parameter'].sudo()
+        last_leave_id = int(config.get_param(param, 0))
+
+        leaves = self.search([
+            ('id', '>', last_leave_id),
+            ('state', 'not in', ['cancel', 'refuse']),
+        ], order='id', limit=limit)
+        outdated = leaves._get_outdated_length_leaves()
+        (leaves - outdated).filtered('length_outdated').write({
+            'length_outdated': False,
+        })
+        outdated.filtered(lambda leave: not leave.length_outdated).write({
+            'length_outdated': True,
+        })
+        if outdated:
+            _logger.info(
+                '%s leave(s) with outdated length: %s',
+                len(outdated),
+                outdated.ids,
+            )
+
+        config.set_param(
+            param, leaves[-1].id if len(leaves) == limit else 0)
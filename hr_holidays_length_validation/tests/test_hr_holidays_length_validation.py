@@ -1,6 +1,8 @@
 # Copyright 2019 Brainbean Apps (https://brainbeanapps.com)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl.html).
 
+from unittest.mock import patch
+
 from odoo.tests import common
 from odoo.exceptions import UserError
 
@@ -14,6 +16,7 @@ class TestHrHolidaysLengthValidation(common.TransactionCase):
 
         self.tuesday = date(2018, 2, 5)
         self.wednesday = date(2018, 2, 6)
+        self.thursday = date(2018, 2, 7)
         self.Employee = self.env['hr.employee']
         self.SudoEmployee = self.Employee.sudo()
         self.LeaveType = self.env['hr.leave.type']
@@ -182,3 +185,99 @@ class TestHrHolidaysLengthValidation(common.TransactionCase):
         leave.action_validate()
         with self.assertRaises(UserError):
             leave.action_validate_length()
+
+    def test_5(self):
+        employee_1 = self.SudoEmployee.create({
+            'name': 'Employee #5.1',
+        })
+        employee_2 = self.SudoEmployee.create({
+            'name': 'Employee #5.2',
+        })
+        leave_type = self.SudoLeaveType.create({
+            'name': 'Leave Type #5',
+            'allocation_type': 'no',
+            'validity_start': False,
+        })
+
+        leave_1 = self.SudoLeave.create({
+            'holiday_status_id': leave_type.id,
+            'holiday_type': 'employee',
+            'employee_id': employee_1.id,
+            'date_from': datetime.combine(self.wednesday, time.min),
+            'date_to': datetime.combine(self.wednesday, time.max),
+        })
+        leave_1._onchange_leave_dates()
+        leave_2 = self.SudoLeave.create({
+            'holiday_status_id': leave_type.id,
+            'holiday_type': 'employee',
+            'employee_id': employee_2.id,
+            'date_from': datetime.combine(self.tuesday, time.min),
+            'date_to': datetime.combine(self.wednesday, time.max),
+            'number_of_days': 3,
+        })
+        leave_3 = self.SudoLeave.create({
+            'holiday_status_id': leave_type.id,
+            'holiday_type': 'employee',
+            'employee_id': employee_2.id,
+            'date_from': datetime.combine(self.thursday, time.min),
+            'date_to': datetime.combine(self.thursday, time.max),
+        })
+        leave_3._onchange_leave_dates()
+        leaves = leave_1 | leave_2 | leave_3
+
+        self.assertEqual(leaves._get_outdated_length_leaves(), leave_2)
+
+        self.env['ir.config_parameter'].sudo().set_param(
+            'hr_holidays_length_validation.last_leave_id', leave_1.id - 1)
+        self.SudoLeave._cron_validate_length()
+        self.assertEqual(
+            leaves.filtered('length_outdated'),
+            leave_2,
+        )
+
+        leave_2.number_of_days = 2
+        self.assertFalse(leave_2.length_outdated)
+
+    def test_6(self):
+        employee = self.SudoEmployee.create({
+            'name': 'Employee #6',
+        })
+        leave_type = self.SudoLeaveType.create({
+            'name': 'Leave Type #6',
+            'allocation_type': 'no',
+            'validity_start': False,
+        })
+        leave = self.SudoLeave.create({
+            'holiday_status_id': leave_type.id,
+            'holiday_type': 'employee',
+            'employee_id': employee.id,
+            'date_from': datetime.combine(self.wednesday, time.min),
+            'date_to': datetime.combine(self.wednesday, time.max),
+        })
+        leave._onchange_leave_dates()
+        self.assertFalse(leave._get_outdated_length_leaves())
+
+        # The hours are counted through the hooks of the employee, as done
+        # when computing the length of the leave
+        def _get_work_hours(self, start, stop, meta):
+            return (stop - start).total_seconds() / 3600 / 2
+
+        with patch.object(
+            type(self.Employee), '_get_work_hours', _get_work_hours,
+        ):
+            recomputed = leave._get_recomputed_number_of_days()[leave.id]
+            self.assertEqual(
+                recomputed,
+                employee.get_work_days_data(
+                    leave.date_from,
+                    leave.date_to,
+                    domain=[
+                        ('time_type', '=', 'leave'),
+                        '|',
+                        ('holiday_id', '!=', leave.id),
+                        ('holiday_id', '=', False),
+                    ],
+                )['days'],
+            )
+            self.assertEqual(recomputed, leave.number_of_days / 2)
+            self.assertEqual(leave._get_outdated_length_leaves(), leave)
@@ -4,7 +4,7 @@
     "name": "HR Holidays Notify Employee Manager",
     "summary": "Notify employee's manager by mail on Leave Requests "
                "creation.",
-    "version": "12.0.1.1.0",
+    "version": "12.0.1.3.1",
     "category": "Human Resources",
     "website": "https://github.com/OCA/hr",
     "author": "Eficent, Odoo Community Association (OCA)",
@@ -14,6 +14,7 @@
         "hr_holidays_settings"
     ],
     "data": [
-        'views/res_config_settings_view.xml'
+        'views/hr_leave_templates.xml',
+        'views/res_config_settings_view.xml',
     ],
 }
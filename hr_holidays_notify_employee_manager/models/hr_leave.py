@@ -1,7 +1,9 @@
 # Copyright 2017 Eficent Business and IT Consulting Services S.L.
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import api, models
+from collections import defaultdict
+
+from odoo import _, api, models
 
 
 class HRLeave(models.Model):
@@ -16,23 +18,54 @@ class HRLeave(models.Model):
             return self.employee_id.parent_id
         return False
 
-    @api.model
-    def create(self, vals):
-        res = super(HRLeave, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super(HRLeave, self).create(vals_list)
         res._notify_approvers()
         return res
 
     @api.multi
     def _notify_approvers(self):
-        """Input: res.user"""
-        self.ensure_one()
-        approvers = self._get_approvers_to_notify()
-        if not approvers:
-            return True
-        for approver in approvers:
-            self.add_follower(approver.id)
-            if approver.user_id:
-                self._message_auto_subscribe_notify(
-                    [approver.user_id.partner_id.id],
-                    template='mail.message_user_assigned')
+        """Subscribe the approvers to their leaves and notify each of them
+        once: leaves created together are sent as a single digest."""
+        leaves_by_approver = defaultdict(lambda: self.browse())
+        for leave in self:
+            company = leave.employee_id.company_id
+            for approver in leave._get_approvers_to_notify() or []:
+                leaves_by_approver[(approver, company)] |= leave
+
+        for (approver, company), leaves in leaves_by_approver.items():
+            if not approver.user_id:
+                continue
+            partner = approver.user_id.partner_id
+            leaves.message_subscribe(partner_ids=partner.ids)
+            leaves = leaves.with_context(
+                mail_notify_force_send=not company.sudo(
+                ).leave_notify_manager_queue,
+            )
+            if len(leaves) == 1:
+                leaves._message_auto_subscribe_notify(
+                    partner.ids, template='mail.message_user_assigned')
+            else:
+                leaves._notify_approver_digest(partner)
         return True
+
+    @api.multi
+    def _notify_approver_digest(self, partner):
+        """Notify the approver of all the given leaves with a single
+        message."""
+        view = self.env.ref(
+            'hr_holidays_notify_employee_manager.message_leave_digest')
+        body = view.render({
+            'leaves': self,
+            'partner': partner,
+        }, engine='ir.qweb', minimal_qcontext=True)
+        body = self.env['mail.thread']._replace_local_links(body)
+        model_description = self.env['ir.model']._get(self._name).display_name
+        return self.browse().message_notify(
+            subject=_('%s leave requests to approve') % len(self),
+            body=body,
+            partner_ids=[(4, partner.id)],
+            notif_layout='mail.mail_notification_light',
+            model_description=model_description,
+        )
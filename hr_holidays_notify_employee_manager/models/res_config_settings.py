@@ -12,3 +12,8 @@ class ResConfigSettings(models.TransientModel):
         string="Leave Requests notified to employee's manager",
         help="When a leave request is created the employee's manager "
              "will be added as follower and notified by email.")
+    leave_notify_manager_queue = fields.Boolean(
+        related='company_id.leave_notify_manager_queue', readonly=False,
+        string="Queue Leave Requests notifications",
+        help="Leave requests notifications are sent by the mail queue "
+             "instead of during the creation of the leave requests.")
@@ -72,3 +72,59 @@ class TestNotifyEmployeeManager(TransactionCase):
             'partner_id') if manager else False
         self.assertTrue(follower_set, "Employee's manager hasn't been added "
                                       "as follower.")
+
+    def test_notify_digest(self):
+        """Tests that the employee's manager is notified once of the leave
+        requests created together, and follows all of them.
+        """
+        manager = self.manager.partner_id
+        self.employee.company_id.leave_notify_manager = True
+        self.employee.company_id.leave_notify_manager_queue = True
+        holiday_type = self.type_model.create({
+            'name': 'Leave without allocation',
+            'allocation_type': 'no',
+        })
+        leaves = self.hol_model.sudo(self.user).create([{
+            'name': 'Leave %s' % day,
+            'employee_id': self.employee.id,
+            'holiday_status_id': holiday_type.id,
+            'date_from': '2019-06-%02d 08:00:00' % day,
+            'date_to': '2019-06-%02d 17:00:00' % day,
+        } for day in (3, 4, 5)])
+        for leave in leaves:
+            self.assertIn(manager, leave.message_follower_ids.mapped(
+                'partner_id'))
+        mails = self.env['mail.mail'].search([
+            ('recipient_ids', 'in', manager.ids),
+            ('subject', '=', '3 leave requests to approve'),
+        ])
+        self.assertEqual(len(mails), 1)
+        self.assertEqual(mails.state, 'outgoing')
+
+    def test_notify_digest_inbox(self):
+        """Tests that the digest follows the notification preference of
+        the manager.
+        """
+        manager = self.manager.partner_id
+        self.manager.notification_type = 'inbox'
+        self.employee.company_id.leave_notify_manager = True
+        holiday_type = self.type_model.create({
+            'name': 'Leave without allocation',
+            'allocation_type': 'no',
+        })
+        self.hol_model.sudo(self.user).create([{
+            'name': 'Leave %s' % day,
+            'employee_id': self.employee.id,
+            'holiday_status_id': holiday_type.id,
+            'date_from': '2019-06-%02d 08:00:00' % day,
+            'date_to': '2019-06-%02d 17:00:00' % day,
+        } for day in (10, 11)])
+        message = self.env['mail.message'].search([
+            ('partner_ids', 'in', manager.ids),
+            ('subject', '=', '2 leave requests to approve'),
+        ])
+        self.assertEqual(len(message), 1)
+        self.assertIn(manager, message.needaction_partner_ids)
+        self.assertFalse(self.env['mail.mail'].search([
+            ('mail_message_id', '=', message.id),
+        ]))
@@ -8,7 +8,7 @@
               'Odoo Community Association (OCA)',
     'website': "https://github.com/OCA/hr",
     'category': 'Human Resources',
-    'version': '12.0.1.0.0',
+    'version': '12.0.1.1.1',
     'license': 'AGPL-3',
     'depends': [
         'hr_holidays',
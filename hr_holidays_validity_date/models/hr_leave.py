@@ -2,6 +2,7 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
 from odoo import models, fields, api, _
+from odoo.exceptions import ValidationError
 
 
 class HrLeaveType(models.Model):
@@ -14,6 +15,25 @@ class HrLeaveType(models.Model):
              "display a warning to the user."
     )
 
+    @api.multi
+    def _get_validity_windows(self):
+        """Read the validity windows of the leave types at once.
+
+        :return: dict mapping the ids of the leave types having a validity
+                 window to a dict with its ``start``, ``stop``,
+                 ``restrict_dates`` and ``name``.
+        """
+        return {
+            leave_type.id: {
+                'start': leave_type.validity_start,
+                'stop': leave_type.validity_stop,
+                'restrict_dates': leave_type.restrict_dates,
+                'name': leave_type.display_name,
+            }
+            for leave_type in self
+            if leave_type.validity_start and leave_type.validity_stop
+        }
+
 
 class HolidaysRequest(models.Model):
     _inherit = "hr.leave"
@@ -25,30 +45,102 @@ class HolidaysRequest(models.Model):
     restrict_dates = fields.Boolean(string='Restrict dates',
                                     related='holiday_status_id.restrict_dates')
 
+    @api.model
+    def _is_out_of_validity(self, window, date_from, date_to):
+        return date_from and date_to and (
+            date_from.date() < window['start']
+            or date_to.date() > window['stop']
+        )
+
     @api.depends('holiday_status_id', 'date_from', 'date_to')
     def _compute_warning_range(self):
+        windows = self.mapped('holiday_status_id')._get_validity_windows()
         for rec in self:
-            if rec.holiday_status_id.validity_start and (
-                    rec.holiday_status_id.validity_stop
-            ):
-                rec.warning_validity = False
-                vstart = rec.holiday_status_id.validity_start
-                vstop = rec.holiday_status_id.validity_stop
-                dfrom = rec.date_from
-                dto = rec.date_to
-
-                if dfrom and dto and (
-                        dfrom.date() < vstart or dto.date() > vstop
-                ):
-                        rec.warning_validity = _(
-                            'Warning: You can take %s only between %s and %s'
-                        ) % (rec.holiday_status_id.display_name,
-                             rec.holiday_status_id.validity_start,
-                             rec.holiday_status_id.validity_stop)
+            rec.warning_validity = False
+            window = windows.get(rec.holiday_status_id.id)
+            if window and self._is_out_of_validity(
+                    window, rec.date_from, rec.date_to):
+                rec.warning_validity = _(
+                    'Warning: You can take %s only between %s and %s'
+                ) % (window['name'], window['start'], window['stop'])
+
+    @api.multi
+    def _get_validity_violations(self):
+        """Return the leaves of restricted leave types outside of the
+        validity window of their type, checking all of them in one query.
+        """
+        if not self.ids:
+            return self.browse()
+        self.env.cr.execute("""
+            SELECT l.id
+            FROM hr_leave l
+            JOIN hr_leave_type t ON t.id = l.holiday_status_id
+            WHERE l.id IN %s
+                AND t.restrict_dates
+                AND t.validity_start IS NOT NULL
+                AND t.validity_stop IS NOT NULL
+                AND l.date_from IS NOT NULL
+                AND l.date_to IS NOT NULL
+                AND (l.date_from::date < t.validity_start
+                    OR l.date_to::date > t.validity_stop)
+            ORDER BY l.id""", (tuple(self.ids),))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    @api.model
+    def get_validity_violations(self, vals_list):
+        """Check the values of leaves to create against the validity windows
+        of their leave types, read once for all of them.
+
+        :return: list of tuples with the index of each leave values outside
+                 of the window of a restricted leave type and the message.
+        """
+        windows = self.env['hr.leave.type'].browse(list({
+            values['holiday_status_id'] for values in vals_list
+            if values.get('holiday_status_id')
+        }))._get_validity_windows()
+        violations = []
+        for index, values in enumerate(vals_list):
+            window = windows.get(values.get('holiday_status_id'))
+            if not window or not window['restrict_dates']:
+                continue
+            date_from = fields.Datetime.to_datetime(values.get('date_from'))
+            date_to = fields.Datetime.to_datetime(values.get('date_to'))
+            if self._is_out_of_validity(window, date_from, date_to):
+                violations.append((index, _(
+                    'You can take %s only between %s and %s'
+                ) % (window['name'], window['start'], window['stop'])))
+        return violations
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Check all the leaves against the validity windows before creating
+        them, so that every leave out of range is reported together."""
+        violations = self.get_validity_violations(vals_list)
+        if violations:
+            raise ValidationError('\n'.join(
+                _('Leave %s: %s') % (
+                    vals_list[index].get('name') or index + 1, message)
+                for index, message in violations
+            ))
+        return super(HolidaysRequest, self).create(vals_list)
 
     @api.multi
     @api.constrains('holiday_status_id', 'date_to', 'date_from')
     def _check_leave_type_validity(self):
+        violations = self._get_validity_violations()
+        if violations:
+            windows = violations.mapped(
+                'holiday_status_id'
+            )._get_validity_windows()
+            raise ValidationError('\n'.join(
+                _('%s: you can take %s only between %s and %s') % (
+                    leave.display_name,
+                    windows[leave.holiday_status_id.id]['name'],
+                    windows[leave.holiday_status_id.id]['start'],
+                    windows[leave.holiday_status_id.id]['stop'],
+                )
+                for leave in violations
+            ))
         super(
             HolidaysRequest,
             self.filtered('restrict_dates')
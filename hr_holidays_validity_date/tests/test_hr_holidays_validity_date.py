@@ -78,3 +78,37 @@ class TestHrHolidaysValidityDate(common.TransactionCase):
         }
         holidays = self.holidays_obj.create(leave_vals)
         self.assertIn('Warning', holidays.warning_validity)
+
+    def test_holidays_validity_batch(self):
+        self.type01.restrict_dates = True
+        self.type01.validity_start = '2019-06-01'
+        self.type01.validity_stop = '2019-06-30'
+        employee02 = self.env['hr.employee'].create({
+            'name': 'Employee 2'
+        })
+        vals_list = [{
+            'employee_id': employee.id,
+            'holiday_status_id': self.type01.id,
+            'name': 'test %s' % index,
+            'date_from': date_from,
+            'date_to': date_to,
+            'number_of_days': 1,
+        } for index, (employee, date_from, date_to) in enumerate([
+            (self.employee01, '2019-06-10 08:00:00', '2019-06-10 17:00:00'),
+            (self.employee01, '2019-07-01 08:00:00', '2019-07-01 17:00:00'),
+            (employee02, '2019-05-31 08:00:00', '2019-05-31 17:00:00'),
+        ])]
+
+        violations = self.holidays_obj.get_validity_violations(vals_list)
+        self.assertEqual([index for index, message in violations], [1, 2])
+
+        with self.assertRaises(ValidationError) as error, \
+                self.env.cr.savepoint():
+            self.holidays_obj.create(vals_list)
+        messages = error.exception.name.splitlines()
+        self.assertEqual(len(messages), 2)
+        self.assertIn('test 1', messages[0])
+        self.assertIn('test 2', messages[1])
+
+        leaves = self.holidays_obj.create(vals_list[:1])
+        self.assertFalse(leaves._get_validity_violations())
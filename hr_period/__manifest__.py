@@ -4,7 +4,7 @@
 
 {
     'name': 'HR Payroll Period',
-    'version': '12.0.1.0.1',
+    'version': '12.0.1.3.6',
     'license': 'AGPL-3',
     'category': 'Generic Modules/Human Resources',
     'summary': "Add payroll periods",
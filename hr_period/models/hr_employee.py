@@ -3,16 +3,80 @@
 
 from odoo import api, fields, models
 
+NEGATIVE_OPERATORS = {
+    '!=': '=',
+    'not in': 'in',
+    'not like': 'like',
+    'not ilike': 'ilike',
+}
+
 
 class HrEmployee(models.Model):
     _inherit = 'hr.employee'
 
     contract_id = fields.Many2one(search='_search_contract')
 
+    @api.model
+    def _get_last_contract_query(self):
+        """ Query of the last contract of each employee, like the computation
+        of contract_id
+        """
+        contract_model = self.env['hr.contract']
+        query = contract_model._where_calc([])
+        contract_model._apply_ir_rules(query, 'read')
+        from_clause, where_clause, params = query.get_sql()
+        sql = """
+            SELECT DISTINCT ON ("hr_contract"."employee_id")
+                "hr_contract"."id", "hr_contract"."employee_id"
+            FROM %s
+            WHERE %s
+            ORDER BY "hr_contract"."employee_id",
+                "hr_contract"."date_start" DESC, "hr_contract"."id" DESC
+        """ % (
+            from_clause,
+            ' AND '.join(filter(None, [
+                where_clause, '"hr_contract"."employee_id" IS NOT NULL'])),
+        )
+        return sql, params
+
+    @api.model
+    def _get_last_contract_domain(self, contract_domain, negate=False):
+        """ Domain of the employees whose last contract matches the given
+        domain on hr.contract, as a subquery, so that the contract ids are
+        never loaded in memory
+
+        :param negate: whether to return the other employees, including the
+                       ones without contract
+        """
+        last_sql, last_params = self._get_last_contract_query()
+        contract_model = self.env['hr.contract']
+        query = contract_model._where_calc(contract_domain)
+        from_clause, where_clause, params = query.get_sql()
+        subquery = """
+            SELECT "last"."employee_id" FROM (%s) AS "last"
+            WHERE "last"."id" IN (
+                SELECT "hr_contract"."id" FROM %s WHERE %s)
+        """ % (last_sql, from_clause, where_clause or 'TRUE')
+        return [(
+            'id',
+            'not inselect' if negate else 'inselect',
+            (subquery, last_params + params),
+        )]
+
     @api.model
     def _search_contract(self, operator, value):
-        res = []
-        contract_ids = self.env['hr.contract'].search(
-            [('employee_id', operator, value)])
-        res.append(('id', 'in', contract_ids.ids))
-        return res
+        """ Search the employees whose last contract matches. Like on other
+        many2one fields, negative operators also match the employees
+        without contract.
+        """
+        if value is False and operator in ('=', '!='):
+            return self._get_last_contract_domain(
+                [], negate=operator == '=')
+        negate = operator in NEGATIVE_OPERATORS
+        if negate:
+            operator = NEGATIVE_OPERATORS[operator]
+        if isinstance(value, str):
+            contract_domain = [('name', operator, value)]
+        else:
+            contract_domain = [('id', operator, value)]
+        return self._get_last_contract_domain(contract_domain, negate=negate)
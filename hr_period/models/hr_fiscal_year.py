@@ -27,6 +27,10 @@ INTERVALS = {
     'daily': (relativedelta(days=1), 365),
 }
 
+OPEN_SCHEDULE_FIELDS = ['state', 'company_id', 'schedule_pay', 'date_start',
+                        'type_id', 'active']
+OPEN_SCHEDULE_MEMO = 'hr_fiscalyear.open_schedule'
+
 
 @api.model
 def get_schedules(self):
@@ -139,18 +143,92 @@ class HrFiscalYear(models.Model):
                           strptime(str(self.date_start), DF)).days) + 1
         return INTERVALS[self.schedule_pay][1] * days_range / 365
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._clear_open_schedule_memo()
+        return super(HrFiscalYear, self).create(vals_list)
+
+    @api.multi
+    def write(self, vals):
+        if any(field in vals for field in OPEN_SCHEDULE_FIELDS):
+            self._clear_open_schedule_memo()
+        return super(HrFiscalYear, self).write(vals)
+
+    @api.multi
+    def unlink(self):
+        self._clear_open_schedule_memo()
+        return super(HrFiscalYear, self).unlink()
+
+    @api.model
+    def _clear_open_schedule_memo(self):
+        self.env.cr.cache.pop(OPEN_SCHEDULE_MEMO, None)
+
+    @api.model
+    def _get_open_schedule(self, company_id):
+        """ Get the schedule of the first open fiscal year of a company,
+        memoized on the cursor so that it is searched once per request and
+        user
+        """
+        memo = self.env.cr.cache.setdefault(OPEN_SCHEDULE_MEMO, {})
+        key = (self.env.uid, company_id)
+        if key not in memo:
+            memo[key] = self.search([
+                ('state', '=', 'open'),
+                ('company_id', '=', company_id),
+            ], limit=1).schedule_pay
+        return memo[key]
+
+    @api.model
+    def _get_fiscal_year_name(self, date_start, schedule_pay):
+        year = datetime.strptime(str(date_start), DF).year
+        schedule_name = next((
+            s[1] for s in get_schedules(self)
+            if s[0] == schedule_pay), False)
+        return '%(year)s - %(schedule)s' % {
+            'year': year,
+            'schedule': schedule_name,
+        }
+
     @api.multi
     @api.onchange('schedule_pay', 'date_start')
     def onchange_schedule(self):
         if self.schedule_pay and self.date_start:
-            year = datetime.strptime(str(self.date_start), DF).year
-            schedule_name = next((
-                s[1] for s in get_schedules(self)
-                if s[0] == self.schedule_pay), False)
-            self.name = '%(year)s - %(schedule)s' % {
-                'year': year,
-                'schedule': schedule_name,
-            }
+            self.name = self._get_fiscal_year_name(
+                self.date_start, self.schedule_pay)
+
+    @api.model
+    def generate_fiscal_years(self, companies, schedules, date_start=None,
+                              date_end=None, vals=None, periods=True):
+        """
+        Create the fiscal years of several companies and schedules at once
+        :param companies: res.company recordset
+        :param schedules: list of schedule_pay keys
+        :param vals: extra values given to every fiscal year, e.g. the
+                     payment day and week settings
+        :param periods: whether the periods are created as well
+        :rtype: hr.fiscalyear recordset
+        """
+        date_start = date_start or self._default_date_start()
+        date_end = date_end or self._default_date_end()
+        vals_list = []
+        for company in companies:
+            fy_type = self._default_type(company.id)
+            for schedule_pay in schedules:
+                fy_vals = dict(vals or {})
+                fy_vals.update({
+                    'name': self._get_fiscal_year_name(
+                        date_start, schedule_pay),
+                    'date_start': date_start,
+                    'date_end': date_end,
+                    'schedule_pay': schedule_pay,
+                    'company_id': company.id,
+                    'type_id': fy_type.id,
+                })
+                vals_list.append(fy_vals)
+        fiscal_years = self.create(vals_list)
+        if periods:
+            fiscal_years.create_periods()
+        return fiscal_years
 
     @api.model
     def get_generator_vals(self):
@@ -198,13 +276,30 @@ class HrFiscalYear(models.Model):
         """
         Create every periods a payroll fiscal year
         """
+        self.mapped('period_ids').unlink()
+        period_types = {}
+        vals_list = []
         for fy in self:
-            for period in fy.period_ids:
-                period.unlink()
-            fy.refresh()
+            company_id = fy.company_id.id
+            if company_id not in period_types:
+                period_types[company_id] = self.env[
+                    'hr.period']._default_type(company_id)
+            vals_list += fy._get_periods_vals(period_types[company_id])
+        self.env['hr.period'].create(vals_list)
+        self.invalidate_cache(['period_ids'])
+        return True
+
+    @api.multi
+    def _get_period_dates(self):
+        """
+        Get the first and last day of every period of the fiscal year
+        :rtype: list of (date_start, date_end) datetime tuples
+        """
+        self.ensure_one()
         if self.date_start > self.date_end:
             raise UserError(_('''Date stop cannot be sooner than the date start
                                 '''))
+        dates = []
         if self.schedule_pay == 'semi-monthly':
             period_start = datetime.strptime(
                 str(self.date_start), DF)
@@ -213,28 +308,54 @@ class HrFiscalYear(models.Model):
             #  Case for semi-monthly schedules
             delta_1 = relativedelta(days=14)
             delta_2 = relativedelta(months=1)
-            i = 1
             while not period_start + delta_2 > next_year_start:
-                # create periods for one month
+                # periods for one month
                 half_month = period_start + delta_1
-                self._create_single_period(period_start, half_month, i)
-                self._create_single_period(
+                dates.append((period_start, half_month))
+                dates.append((
                     half_month + relativedelta(days=1),
-                    period_start + delta_2 - relativedelta(days=1), i + 1)
+                    period_start + delta_2 - relativedelta(days=1)))
                 # setup for next month
                 period_start += delta_2
-                i += 2
         else:
-            i = 0
             for period in self.get_ranges():
-                i += 1
-                period_start = strptime(
-                    str(period.get('date_start', False)), DF)
-                period_end = strptime(
-                    str(period.get('date_end', False)), DF)
-                self._create_single_period(
-                    period_start, period_end, i)
-        return True
+                dates.append((
+                    strptime(str(period.get('date_start', False)), DF),
+                    strptime(str(period.get('date_end', False)), DF)))
+        return dates
+
+    @api.multi
+    def _get_periods_vals(self, period_type=None):
+        """ Get the values of every payroll period of the fiscal year
+        :param period_type: the date.range.type of the periods
+        """
+        self.ensure_one()
+        if period_type is None:
+            period_type = self.env['hr.period']._default_type(
+                self.company_id.id)
+        return [
+            self._prepare_period_vals(date_start, date_end, number,
+                                      period_type)
+            for number, (date_start, date_end) in enumerate(
+                self._get_period_dates(), 1)
+        ]
+
+    @api.multi
+    def _prepare_period_vals(self, date_start, date_end, number,
+                             period_type):
+        self.ensure_one()
+        return {
+            'fiscalyear_id': self.id,
+            'date_start': date_start,
+            'date_end': date_end,
+            'date_payment': self._get_day_of_payment(date_end),
+            'company_id': self.company_id.id,
+            'name': _('%s Period #%s') % (self.name, number),
+            'number': number,
+            'state': 'draft',
+            'type_id': period_type.id,
+            'schedule_pay': self.schedule_pay,
+        }
 
     @api.multi
     def _create_single_period(self, date_start, date_end, number):
@@ -244,19 +365,8 @@ class HrFiscalYear(models.Model):
         """
         self.ensure_one()
         period_type = self.env['hr.period']._default_type(self.company_id.id)
-        self.write({
-            'period_ids': [(0, 0, {
-                'date_start': date_start,
-                'date_end': date_end,
-                'date_payment': self._get_day_of_payment(date_end),
-                'company_id': self.company_id.id,
-                'name': _('%s Period #%s') % (self.name, number),
-                'number': number,
-                'state': 'draft',
-                'type_id': period_type.id,
-                'schedule_pay': self.schedule_pay,
-            })],
-        })
+        return self.env['hr.period'].create(self._prepare_period_vals(
+            date_start, date_end, number, period_type))
 
     @api.multi
     def _get_day_of_payment(self, date_end):
@@ -67,17 +67,37 @@ class HrPayslip(models.Model):
             self.date_to = self.hr_period_id.date_end
             self.date_payment = self.hr_period_id.date_payment
 
-    @api.model
-    def create(self, vals):
-        if vals.get('payslip_run_id'):
-            payslip_run = self.env['hr.payslip.run'].browse(
-                vals['payslip_run_id'])
-            employee = self.env['hr.employee'].browse(vals['employee_id'])
-            period = payslip_run.hr_period_id
-            vals['date_payment'] = payslip_run.date_payment
-            vals['hr_period_id'] = period.id
-            vals['name'] = _('Salary Slip of %s for %s') % (
-                employee.name, period.name)
-        elif vals.get('date_to') and not vals.get('date_payment'):
-            vals['date_payment'] = vals['date_to']
-        return super(HrPayslip, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        run_vals_list = [
+            vals for vals in vals_list if vals.get('payslip_run_id')]
+        if run_vals_list:
+            # read the batches, periods and employees once for all payslips
+            payslip_runs = self.env['hr.payslip.run'].browse(
+                list({vals['payslip_run_id'] for vals in run_vals_list}))
+            employees = self.env['hr.employee'].browse(
+                list({vals['employee_id'] for vals in run_vals_list}))
+            payslip_runs.mapped('hr_period_id.name')
+            employees.mapped('name')
+        for vals in vals_list:
+            if vals.get('payslip_run_id'):
+                payslip_run = self.env['hr.payslip.run'].browse(
+                    vals['payslip_run_id'])
+                employee = self.env['hr.employee'].browse(
+                    vals['employee_id'])
+                period = payslip_run.hr_period_id
+                vals['date_payment'] = payslip_run.date_payment
+                vals['hr_period_id'] = period.id
+                vals['name'] = _('Salary Slip of %s for %s') % (
+                    employee.name, period.name)
+            elif vals.get('date_to') and not vals.get('date_payment'):
+                vals['date_payment'] = vals['date_to']
+        return super(HrPayslip, self).create(vals_list)
+
+    @api.multi
+    def compute_sheet(self):
+        chunk_size = self.env.context.get('payslip_compute_chunk_size')
+        if chunk_size and len(self) > chunk_size:
+            return self.env['hr.payslip.run'].compute_payslips(
+                self, chunk_size=chunk_size)
+        return super(HrPayslip, self).compute_sheet()
@@ -2,8 +2,9 @@
 # Copyright 2017 Serpent Consulting Services Pvt. Ltd.
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import models, fields
+from odoo import api, fields, models
 from .hr_fiscal_year import get_schedules
+from .hr_payslip_run import COMPUTE_CHUNK_SIZE
 
 
 class HrPayslipEmployees(models.TransientModel):
@@ -20,3 +21,13 @@ class HrPayslipEmployees(models.TransientModel):
         'Scheduled Pay',
         readonly=True
     )
+
+    @api.multi
+    def compute_sheet(self):
+        """ Compute the payslips generated for a batch by chunks
+        """
+        wizard = self
+        if self.env.context.get('active_model') == 'hr.payslip.run':
+            wizard = self.with_context(
+                payslip_compute_chunk_size=COMPUTE_CHUNK_SIZE)
+        return super(HrPayslipEmployees, wizard).compute_sheet()
@@ -2,10 +2,17 @@
 # Copyright 2017 Serpent Consulting Services Pvt. Ltd.
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+import logging
+
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
+from odoo.tools import split_every
 from .hr_fiscal_year import get_schedules
 
+_logger = logging.getLogger(__name__)
+
+COMPUTE_CHUNK_SIZE = 500
+
 
 class HrPayslipRun(models.Model):
     _inherit = 'hr.payslip.run'
@@ -61,14 +68,9 @@ class HrPayslipRun(models.Model):
 
     @api.model
     def get_default_schedule(self, company_id):
-        company = self.env['res.company'].browse(company_id)
-
-        fys = self.env['hr.fiscalyear'].search([('state', '=', 'open'),
-                                                ('company_id', '=', company.id)
-                                                ])
         return (
-            fys[0].schedule_pay
-            if fys else 'monthly'
+            self.env['hr.fiscalyear']._get_open_schedule(company_id) or
+            'monthly'
         )
 
     @api.multi
@@ -109,9 +111,7 @@ class HrPayslipRun(models.Model):
 
         company = self.company_id
 
-        employee_ids = self.env['hr.employee'].search(
-            [('company_id', '=', company.id),
-             ('contract_id.schedule_pay', '=', self.schedule_pay)]).ids
+        employee_ids = self._get_payslip_employees().ids
 
         return {
             'type': 'ir.actions.act_window',
@@ -128,6 +128,81 @@ class HrPayslipRun(models.Model):
             }
         }
 
+    @api.multi
+    def _get_payslip_employees(self):
+        """ Get the employees paid with the schedule of the batch
+        """
+        self.ensure_one()
+        employee_model = self.env['hr.employee']
+        return employee_model.search(
+            [('company_id', '=', self.company_id.id)] +
+            employee_model._get_last_contract_domain(
+                [('schedule_pay', '=', self.schedule_pay)]))
+
+    @api.multi
+    def _prepare_payslip_vals(self, employee):
+        self.ensure_one()
+        slip_data = self.env['hr.payslip'].onchange_employee_id(
+            self.date_start, self.date_end, employee.id, contract_id=False)
+        values = slip_data['value']
+        return {
+            'employee_id': employee.id,
+            'struct_id': values.get('struct_id'),
+            'contract_id': values.get('contract_id'),
+            'payslip_run_id': self.id,
+            'input_line_ids': [
+                (0, 0, line) for line in values.get('input_line_ids', [])],
+            'worked_days_line_ids': [
+                (0, 0, line)
+                for line in values.get('worked_days_line_ids', [])],
+            'date_from': self.date_start,
+            'date_to': self.date_end,
+            'credit_note': self.credit_note,
+            'company_id': employee.company_id.id,
+        }
+
+    @api.multi
+    def generate_payslips(self, employees=None, compute=True,
+                          chunk_size=COMPUTE_CHUNK_SIZE):
+        """ Create the payslips of the batch with a single create
+        :param employees: hr.employee recordset, by default the employees
+                          paid with the schedule of the batch
+        :param compute: whether the payslips are computed
+        :param chunk_size: number of payslips computed at once
+        :rtype: hr.payslip recordset
+        """
+        self.ensure_one()
+        if employees is None:
+            employees = self._get_payslip_employees()
+        employees.mapped('company_id')
+        payslips = self.env['hr.payslip'].create([
+            self._prepare_payslip_vals(employee) for employee in employees])
+        if compute:
+            self.compute_payslips(payslips, chunk_size=chunk_size)
+        return payslips
+
+    @api.multi
+    def compute_payslips(self, payslips=None, chunk_size=COMPUTE_CHUNK_SIZE):
+        """ Compute the payslips of the batches by chunks
+
+        Every chunk is computed independently, so the chunks of a large
+        batch can also be given to separate workers.
+        :param payslips: hr.payslip recordset, by default the draft
+                         payslips of the batches
+        :param chunk_size: number of payslips computed at once
+        """
+        if payslips is None:
+            payslips = self.mapped('slip_ids').filtered(
+                lambda slip: slip.state == 'draft')
+        done = 0
+        for chunk_ids in split_every(chunk_size, payslips.ids):
+            self.env['hr.payslip'].browse(chunk_ids).compute_sheet()
+            self.env['hr.payslip'].invalidate_cache(ids=list(chunk_ids))
+            done += len(chunk_ids)
+            _logger.info(
+                'Computed %s/%s payslips', done, len(payslips))
+        return True
+
     @api.multi
     def close_payslip_run(self):
         for run in self:
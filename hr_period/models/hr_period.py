@@ -2,10 +2,14 @@
 # Copyright 2017 Serpent Consulting Services Pvt. Ltd.
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 #
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import UserError
 from .hr_fiscal_year import get_schedules
 
+NEXT_PERIOD_FIELDS = ['company_id', 'schedule_pay', 'state', 'date_start',
+                      'fiscalyear_id', 'active']
+NEXT_PERIOD_MEMO = 'hr_period.next_period'
+
 
 class HrPeriod(models.Model):
     _name = 'hr.period'
@@ -81,17 +85,55 @@ class HrPeriod(models.Model):
         default=_default_type
     )
 
+    @api.model_cr
+    def init(self):
+        tools.create_index(
+            self._cr, 'hr_period_next_period_index', self._table,
+            ['company_id', 'schedule_pay', 'state', 'date_start'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._clear_next_period_memo()
+        return super(HrPeriod, self).create(vals_list)
+
+    @api.multi
+    def write(self, vals):
+        if any(field in vals for field in NEXT_PERIOD_FIELDS):
+            self._clear_next_period_memo()
+        return super(HrPeriod, self).write(vals)
+
+    @api.multi
+    def unlink(self):
+        self._clear_next_period_memo()
+        return super(HrPeriod, self).unlink()
+
+    @api.model
+    def _clear_next_period_memo(self):
+        self.env.cr.cache.pop(NEXT_PERIOD_MEMO, None)
+
+    @api.model
+    def _get_next_period_id(self, company_id, schedule_pay):
+        """ Get the id of the next period, memoized on the cursor so that it
+        is searched once per request, user and schedule
+        """
+        memo = self.env.cr.cache.setdefault(NEXT_PERIOD_MEMO, {})
+        key = (self.env.uid, company_id, schedule_pay)
+        if key not in memo:
+            memo[key] = self.search([
+                ('company_id', '=', company_id),
+                ('schedule_pay', '=', schedule_pay),
+                ('state', '=', 'open'),
+            ], order='date_start', limit=1).id
+        return memo[key]
+
     @api.model
     def get_next_period(self, company_id, schedule_pay):
         """
          Get the next payroll period to process
         :rtype: hr.period browse record
         """
-        period = self.search([
-            ('company_id', '=', company_id),
-            ('schedule_pay', '=', schedule_pay),
-            ('state', '=', 'open'),
-        ], order='date_start', limit=1)
+        period = self.browse(self._get_next_period_id(
+            company_id, schedule_pay))
         return period if period else False
 
     @api.multi
@@ -318,3 +318,37 @@ class TestHrFiscalyear(common.TransactionCase):
         self.assertEqual(periods[2].date_payment, date(2015, 5, 4))
         self.assertEqual(periods[22].date_payment, date(2016, 3, 5))
         self.assertEqual(periods[23].date_payment, date(2016, 3, 19))
+
+    def test_generate_fiscal_years(self):
+        company_2 = self.company_model.create({'name': 'Company 2'})
+        self.create_data_range_type('test_hr_fy_2', 'fy', company_2)
+        type_2 = self.create_data_range_type(
+            'test_hr_period_2', 'per', company_2)
+        companies = self.company + company_2
+        fiscal_years = self.fy_model.generate_fiscal_years(
+            companies, ['monthly', 'weekly'],
+            date_start='2015-01-01', date_end='2015-12-31',
+            vals={'payment_day': '2',
+                  'payment_weekday': '0',
+                  'payment_week': '1'})
+        self.assertEqual(len(fiscal_years), 4)
+        self.assertEqual(fiscal_years.mapped('company_id'), companies)
+        fy_monthly = fiscal_years.filtered(
+            lambda fy: fy.schedule_pay == 'monthly' and
+            fy.company_id == company_2)
+        self.assertEqual(fy_monthly.name, '2015 - Monthly (12)')
+        periods = self.get_periods(fy_monthly)
+        self.assertEqual(len(periods), 12)
+        self.assertEqual(periods.mapped('type_id'), type_2)
+        self.assertEqual(periods.mapped('number'), list(range(1, 13)))
+        self.check_period(periods[1], '2015-02-01', '2015-02-28',
+                          '2015-03-02')
+        fy_weekly = fiscal_years.filtered(
+            lambda fy: fy.schedule_pay == 'weekly' and
+            fy.company_id == self.company)
+        self.assertEqual(len(fy_weekly.period_ids), 52)
+
+        # Regenerating the periods replaces the previous ones
+        fiscal_years.create_periods()
+        self.assertEqual(
+            len(fiscal_years.mapped('period_ids')), 2 * (12 + 52))
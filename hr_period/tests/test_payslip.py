@@ -191,3 +191,146 @@ class PayslipCase(test_hr_fiscalyear.TestHrFiscalyear):
         period = self.env['hr.period'].get_next_period(
             self.company.id, 'quarterly')
         self.assertEqual(payslip.hr_period_id, period)
+
+    def test_next_period_cache(self):
+        period_model = self.env['hr.period']
+        run_model = self.env['hr.payslip.run']
+        self.assertFalse(period_model.get_next_period(
+            self.company2.id, 'monthly'))
+        self.assertEqual(
+            run_model.get_default_schedule(self.company2.id), 'monthly')
+        fy = self.create_fiscal_year({
+            'company_id': self.company2.id,
+            'schedule_pay': 'quarterly',
+            'type_id': self.type_fy2.id,
+        })
+        fy.create_periods()
+        periods = self.get_periods(fy)
+        fy.button_confirm()
+        self.assertEqual(
+            run_model.get_default_schedule(self.company2.id), 'quarterly')
+        self.assertEqual(period_model.get_next_period(
+            self.company2.id, 'quarterly'), periods[0])
+        periods[0].button_close()
+        periods[1].button_open()
+        self.assertEqual(period_model.get_next_period(
+            self.company2.id, 'quarterly'), periods[1])
+        periods[1].active = False
+        self.assertFalse(period_model.get_next_period(
+            self.company2.id, 'quarterly'))
+        fy.active = False
+        self.assertEqual(
+            run_model.get_default_schedule(self.company2.id), 'monthly')
+        fy.active = True
+        fy.button_set_to_draft()
+        self.assertFalse(period_model.get_next_period(
+            self.company2.id, 'quarterly'))
+
+    def test_generate_payslips(self):
+        fy = self.create_fiscal_year({'type_id': self.type_fy.id})
+        fy.create_periods()
+        fy.button_confirm()
+        period = self.get_periods(fy)[0]
+        run = self.run_obj.create(self._prepare_payslip_run_data(period))
+        run.schedule_pay = 'monthly'
+        employee2 = self.env['hr.employee'].create({'name': 'Employee 2'})
+        payslips = run.generate_payslips(
+            self.employee + employee2, compute=False)
+        self.assertEqual(len(payslips), 2)
+        self.assertEqual(run.slip_ids, payslips)
+        self.assertEqual(payslips.mapped('hr_period_id'), period)
+        self.assertEqual(
+            set(payslips.mapped('date_payment')), {period.date_payment})
+        slip = payslips.filtered(lambda p: p.employee_id == self.employee)
+        self.assertEqual(
+            slip.name, 'Salary Slip of Employee 1 for %s' % period.name)
+
+    def test_generate_payslips_compute(self):
+        fy = self.create_fiscal_year({'type_id': self.type_fy.id})
+        fy.create_periods()
+        fy.button_confirm()
+        period = self.get_periods(fy)[0]
+        run = self.run_obj.create(self._prepare_payslip_run_data(period))
+        employee2 = self.env['hr.employee'].create({'name': 'Employee 2'})
+        employees = self.employee + employee2
+        for employee in employees:
+            self.env['hr.contract'].create({
+                'name': 'Contract %s' % employee.name,
+                'employee_id': employee.id,
+                'wage': 1000.0,
+                'schedule_pay': 'monthly',
+                'date_start': fy.date_start,
+                'date_end': fy.date_end,
+                'struct_id': self.env.ref('hr_payroll.structure_base').id,
+                'state': 'open',
+            })
+        payslips = run.generate_payslips(employees, chunk_size=1)
+        self.assertEqual(len(payslips), 2)
+        for slip in payslips:
+            self.assertTrue(slip.line_ids)
+            self.assertEqual(slip.line_ids.filtered(
+                lambda line: line.code == 'NET').total, 1000.0)
+
+        # the employees wizard of a batch computes its payslips by chunks
+        run2 = self.run_obj.create(self._prepare_payslip_run_data(period))
+        wizard = self.wzd_obj.create({
+            'employee_ids': [(6, 0, employees.ids)],
+        })
+        wizard.with_context(
+            active_model='hr.payslip.run', active_id=run2.id,
+        ).compute_sheet()
+        self.assertEqual(len(run2.slip_ids), 2)
+        for slip in run2.slip_ids:
+            self.assertTrue(slip.line_ids)
+
+    def test_search_employee_contract(self):
+        employee_model = self.env['hr.employee']
+        employee2 = employee_model.create({'name': 'Employee 2'})
+        employees = self.employee + employee2
+        # only the last contract of the employee is matched
+        self.contract.date_start = '2015-01-01'
+        self.assertEqual(self.employee.contract_id, self.contract2)
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id.schedule_pay', '=', 'quarterly'),
+        ]), self.employee)
+        self.assertFalse(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id.schedule_pay', '=', 'monthly'),
+        ]))
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', '=', self.contract2.id),
+        ]), self.employee)
+        self.assertFalse(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', '=', self.contract.id),
+        ]))
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', 'ilike', 'Contract 2'),
+        ]), self.employee)
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', '=', False),
+        ]), employee2)
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', '!=', False),
+        ]), self.employee)
+        # as on other many2one, negative operators match no contract
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', '!=', self.contract2.id),
+        ]), employee2)
+        self.assertEqual(employee_model.search([
+            ('id', 'in', employees.ids),
+            ('contract_id', 'not in', self.contract.ids),
+        ]), employees)
+        run = self.run_obj.new({
+            'company_id': self.employee.company_id.id,
+            'schedule_pay': 'quarterly',
+        })
+        self.assertIn(self.employee, run._get_payslip_employees())
+        run.schedule_pay = 'monthly'
+        self.assertNotIn(self.employee, run._get_payslip_employees())
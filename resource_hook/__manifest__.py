@@ -5,7 +5,7 @@
     'name': 'Resource Hook',
     'summary': """
         Extends the resource with hooks to standard methods.""",
-    'version': '12.0.1.0.1',
+    'version': '12.0.1.2.0',
     'license': 'AGPL-3',
     'author': 'Creu Blanca, Odoo Community Association (OCA)',
     'website': 'https://github.com/OCA/hr',
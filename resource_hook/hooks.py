@@ -1,5 +1,4 @@
 from odoo.addons.resource.models.resource_mixin import ResourceMixin, ROUNDING_FACTOR
-from datetime import timedelta
 from odoo.tools import float_utils
 from pytz import utc
 from collections import defaultdict
@@ -33,17 +32,6 @@ def post_load_hook():
         if not to_datetime.tzinfo:
             to_datetime = to_datetime.replace(tzinfo=utc)
 
-        # total hours per day: retrieve attendances with one extra day margin,
-        # in order to compute the total hours on the first and last days
-        from_full = from_datetime - timedelta(days=1)
-        to_full = to_datetime + timedelta(days=1)
-        intervals = calendar._attendance_intervals(
-            from_full, to_full, resource
-        )
-        day_total = defaultdict(float)
-        for start, stop, meta in intervals:
-            day_total[start.date()] += self._get_work_hours(start, stop, meta)
-
         # actual hours per day
         if compute_leaves:
             intervals = calendar._work_intervals(
@@ -53,9 +41,18 @@ def post_load_hook():
             intervals = calendar._attendance_intervals(
                 from_datetime, to_datetime, resource
             )
+        intervals = list(intervals)
+        work_hours = self._get_intervals_work_hours(calendar, intervals)
         day_hours = defaultdict(float)
-        for start, stop, meta in intervals:
-            day_hours[start.date()] += self._get_work_hours(start, stop, meta)
+        for (start, stop, meta), hours in zip(intervals, work_hours):
+            day_hours[start.date()] += hours
+
+        # total hours per day: computed from the compiled template of the
+        # calendar, only for the days with actual hours
+        day_total = {
+            day: self._get_template_day_hours(calendar, day)
+            for day in day_hours
+        }
 
         # compute number of days as quarters
         days = sum(
@@ -0,0 +1,43 @@
+# Copyright 2019 Creu Blanca
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo import api, models, tools
+
+
+class ResourceCalendar(models.Model):
+    _inherit = 'resource.calendar'
+
+    @api.multi
+    @tools.ormcache('self.id')
+    def _get_attendance_template(self):
+        """
+        Compiled weekly representation of the calendar attendances.
+        The result is cached until the attendances are modified, so it
+        must not be altered by the callers.
+        :return: tuple with, for each weekday (0 is Monday), a tuple of the
+        dictionaries returned by `_get_template_values` of the attendances,
+        sorted by starting hour.
+        """
+        self.ensure_one()
+        template = tuple([] for weekday in range(7))
+        for attendance in self.sudo().attendance_ids:
+            values = attendance._get_template_values()
+            template[values['dayofweek']].append(values)
+        return tuple(
+            tuple(sorted(lines, key=lambda line: line['hour_from']))
+            for lines in template
+        )
+
+    @api.multi
+    def _get_template_day_lines(self, day):
+        """
+        Lines of the compiled template that apply on the given day.
+        :param day: date
+        :return: list of template values, sorted by starting hour.
+        """
+        self.ensure_one()
+        return [
+            line for line in self._get_attendance_template()[day.weekday()]
+            if (not line['date_from'] or line['date_from'] <= day) and
+            (not line['date_to'] or day <= line['date_to'])
+        ]
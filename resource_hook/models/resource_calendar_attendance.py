@@ -0,0 +1,41 @@
+# Copyright 2019 Creu Blanca
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo import api, models
+
+
+class ResourceCalendarAttendance(models.Model):
+    _inherit = 'resource.calendar.attendance'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.env['resource.calendar'].clear_caches()
+        return super().create(vals_list)
+
+    @api.multi
+    def write(self, vals):
+        self.env['resource.calendar'].clear_caches()
+        return super().write(vals)
+
+    @api.multi
+    def unlink(self):
+        self.env['resource.calendar'].clear_caches()
+        return super().unlink()
+
+    @api.multi
+    def _get_template_values(self):
+        """
+        Values of the attendance stored in the compiled calendar template.
+        Extend this method to add the values needed by the
+        `_get_template_work_hours` hook.
+        :return: dictionary of plain values
+        """
+        self.ensure_one()
+        return {
+            'id': self.id,
+            'dayofweek': int(self.dayofweek),
+            'hour_from': self.hour_from,
+            'hour_to': self.hour_to,
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+        }
@@ -15,3 +15,57 @@ class ResourceMixin(models.AbstractModel):
         :return: float representing the time worked.
         """
         return (stop - start).total_seconds() / 3600
+
+    def _get_intervals_work_hours(self, calendar, intervals):
+        """
+        Hours worked in each of the intervals of a computation. Extend this
+        method instead of `_get_work_hours` to read the data of the calendar
+        once for all the intervals.
+        :param calendar: resource.calendar record the intervals come from
+        :param intervals: list of (start, stop, meta) tuples
+        :return: list of floats, in the order of the intervals.
+        """
+        return [
+            self._get_work_hours(start, stop, meta)
+            for start, stop, meta in intervals
+        ]
+
+    def _get_template_work_hours(self, hour_from, hour_to, lines):
+        """
+        Hours worked in a slot of the compiled calendar template. This is
+        the counterpart of `_get_work_hours` and `_get_intervals_work_hours`
+        used to compute the total hours of full days, so it should be
+        extended along with them.
+        :param hour_from: float, starting hour of the slot
+        :param hour_to: float, ending hour of the slot
+        :param lines: template values of the attendances merged in the slot
+        :return: float representing the time worked.
+        """
+        return hour_to - hour_from
+
+    def _get_template_day_hours(self, calendar, day):
+        """
+        Total hours of the given day according to the compiled template
+        of the calendar, without materializing any interval.
+        :param calendar: resource.calendar record
+        :param day: date
+        :return: float representing the time worked.
+        """
+        lines = calendar._get_template_day_lines(day)
+        # Overlapping attendances are merged, as done by the intervals
+        hours = 0.0
+        slot = []
+        slot_from = slot_to = None
+        for line in lines:
+            if slot and line['hour_from'] <= slot_to:
+                slot.append(line)
+                slot_to = max(slot_to, line['hour_to'])
+                continue
+            if slot:
+                hours += self._get_template_work_hours(
+                    slot_from, slot_to, slot)
+            slot = [line]
+            slot_from, slot_to = line['hour_from'], line['hour_to']
+        if slot:
+            hours += self._get_template_work_hours(slot_from, slot_to, slot)
+        return hours